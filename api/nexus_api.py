@@ -3,11 +3,15 @@ Nexus Mods API client for Stalker 2 Mod Manager
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import json
 import time
 import hashlib
+import threading
 import logging
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Tuple
 import re
 from urllib.parse import urlparse, urljoin
 from pathlib import Path
@@ -34,21 +38,73 @@ class RateLimitError(NexusAPIError):
         self.retry_after = retry_after
 
 
+class RateLimiter:
+    """Thread-safe token bucket that paces requests to the Nexus API"""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+    
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
 class NexusModsClient:
     """Client for interacting with the Nexus Mods API"""
     
     BASE_URL = config.NEXUS_API_BASE
     GAME_DOMAIN = config.NEXUS_GAME_DOMAIN
     
-    # Rate limiting constants
-    RATE_LIMIT_DELAY = 1.0  # Minimum delay between requests
+    # Rate limiting constants (token bucket: sustained requests per second and burst size)
+    RATE_LIMIT_PER_SECOND = 2.0
+    RATE_LIMIT_BURST = 20
     MAX_RETRIES = 3
     TIMEOUT = 30
     
-    def __init__(self, api_key: str):
-        """Initialize the Nexus Mods API client"""
+    # Download streaming chunk size (64 KiB)
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    
+    # Keep-alive connection pool sizing (must cover concurrent update-check workers)
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = max(8, config.NEXUS_MAX_CONCURRENCY)
+    
+    # How long get_mod_info results are reused before hitting the API again
+    MOD_INFO_CACHE_TTL = 300
+    
+    # Uploaded files rarely change, so their details are reused for longer
+    FILE_INFO_CACHE_TTL = 3600
+    
+    # Persisted validator cache entries older than this are dropped on load
+    HTTP_CACHE_MAX_AGE = 7 * 24 * 3600
+    
+    # Transient gateway errors retried inside the adapter; 429 and network
+    # errors are handled by _make_request
+    GATEWAY_RETRY_STATUSES = (502, 503, 504)
+    
+    def __init__(self, api_key: str, http_cache: Optional[Any] = None):
+        """Initialize the Nexus Mods API client
+        
+        http_cache is an optional store with load_entries()/save_entries() (such as
+        database.models.HttpCacheManager) used to keep ETags across sessions.
+        """
         self.api_key = api_key
-        self.session = requests.Session()
+        self.http_cache = http_cache
+        self.session = self._create_session()
         
         # Create a proper User-Agent string with system info
         import platform
@@ -63,7 +119,33 @@ class NexusModsClient:
             "User-Agent": user_agent,
             "Content-Type": "application/json"
         })
-        self.last_request_time = 0
+        self._rate_limiter = RateLimiter(self.RATE_LIMIT_PER_SECOND, self.RATE_LIMIT_BURST)
+        
+        # Caps in-flight API requests across all worker threads so they never
+        # outnumber the keep-alive pool and force throwaway connections
+        self._request_slots = threading.BoundedSemaphore(config.NEXUS_MAX_CONCURRENCY)
+        
+        # Separate persistent session for file downloads so the API key isn't sent
+        # to the CDN, while still reusing keep-alive connections across downloads
+        self.download_session = self._create_session()
+        self.download_session.headers.update({
+            "User-Agent": "Stalker2ModManager/1.0"
+        })
+        
+        # HTTP validators and last body per GET request: {key: (etag, last_modified, body)}
+        self._validator_cache: Dict[str, Tuple[Optional[str], Optional[str], Any]] = {}
+        self._dirty_cache_keys = set()
+        if http_cache is not None:
+            try:
+                self._validator_cache.update(http_cache.load_entries(self.HTTP_CACHE_MAX_AGE))
+            except Exception as e:
+                logger.warning(f"Could not load persisted HTTP cache: {e}")
+        
+        # Short-lived mod info cache keyed by mod ID: {mod_id: (fetched_at, mod_data)}
+        self._mod_info_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        
+        # File info cache keyed by (mod ID, file ID): {(mod_id, file_id): (fetched_at, file_data)}
+        self._file_info_cache: Dict[Tuple[int, int], Tuple[float, Dict[str, Any]]] = {}
         
         # Rate limiting tracking
         self.daily_remaining = None
@@ -73,27 +155,43 @@ class NexusModsClient:
         
         logger.info(f"Initialized Nexus Mods API client with User-Agent: {user_agent}")
     
+    def _create_session(self) -> requests.Session:
+        """Create a session with a pooled keep-alive HTTP adapter and gateway retries"""
+        session = requests.Session()
+        retries = Retry(
+            total=2,
+            connect=0,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=self.GATEWAY_RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retries
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make a rate-limited request to the Nexus API"""
-        # Rate limiting
-        time_since_last = time.time() - self.last_request_time
-        if time_since_last < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - time_since_last)
-        
         url = urljoin(self.BASE_URL.rstrip('/') + '/', endpoint.lstrip('/'))
 
         for attempt in range(self.MAX_RETRIES):
             try:
                 logger.debug(f"Making {method} request to {url} (attempt {attempt + 1})")
                 
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    timeout=self.TIMEOUT,
-                    **kwargs
-                )
-                
-                self.last_request_time = time.time()
+                self._rate_limiter.acquire()
+                with self._request_slots:
+                    response = self.session.request(
+                        method=method,
+                        url=url,
+                        timeout=self.TIMEOUT,
+                        **kwargs
+                    )
                 
                 # Parse rate limiting headers
                 self._parse_rate_limit_headers(response)
@@ -136,6 +234,40 @@ class NexusModsClient:
         
         raise NexusAPIError("Max retries exceeded")
     
+    def _get_json(self, endpoint: str, **kwargs) -> Any:
+        """GET a JSON endpoint, revalidating a previously seen body with ETag/Last-Modified"""
+        params = kwargs.get("params")
+        cache_key = f"{endpoint}?{sorted(params.items())}" if params else endpoint
+        cached = self._validator_cache.get(cache_key)
+        
+        if cached:
+            etag, last_modified, _ = cached
+            headers = {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+            kwargs["headers"] = headers
+        
+        response = self._make_request("GET", endpoint, **kwargs)
+        
+        # Unchanged since the last fetch: reuse the cached body
+        if cached and response.status_code == 304:
+            logger.debug(f"Not modified, using cached response for {endpoint}")
+            return cached[2]
+        
+        data = response.json()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if isinstance(etag, str) or isinstance(last_modified, str):
+            self._validator_cache[cache_key] = (
+                etag if isinstance(etag, str) else None,
+                last_modified if isinstance(last_modified, str) else None,
+                data
+            )
+            self._dirty_cache_keys.add(cache_key)
+        return data
+    
     def _parse_rate_limit_headers(self, response: requests.Response):
         """Parse rate limiting headers from the response"""
         headers = response.headers
@@ -158,7 +290,9 @@ class NexusModsClient:
             except (ValueError, TypeError):
                 self.hourly_remaining = None
         
-        # Log rate limit status if we're getting low
+        # Log rate limit status if we're getting low. Requests are not slowed down on a
+        # low hourly count: the hourly cap only applies once the daily quota is spent,
+        # and an exhausted quota surfaces as 429 + Retry-After in _make_request
         if self.daily_remaining is not None and self.daily_remaining < 100:
             logger.warning(f"Daily API requests remaining: {self.daily_remaining}")
         
@@ -188,11 +322,16 @@ class NexusModsClient:
             raise
     
     def get_mod_info(self, mod_id: int) -> Dict[str, Any]:
-        """Get mod information from Nexus Mods"""
+        """Get mod information from Nexus Mods (cached for MOD_INFO_CACHE_TTL seconds)"""
+        cached = self._mod_info_cache.get(mod_id)
+        if cached and time.monotonic() - cached[0] < self.MOD_INFO_CACHE_TTL:
+            logger.debug(f"Using cached mod info for ID {mod_id}")
+            return cached[1]
+        
         try:
             endpoint = f"/games/{self.GAME_DOMAIN}/mods/{mod_id}.json"
-            response = self._make_request("GET", endpoint)
-            mod_data = response.json()
+            mod_data = self._get_json(endpoint)
+            self._mod_info_cache[mod_id] = (time.monotonic(), mod_data)
             
             logger.info(f"Retrieved mod info for ID {mod_id}: {mod_data.get('name', 'Unknown')}")
             return mod_data
@@ -201,6 +340,13 @@ class NexusModsClient:
             logger.error(f"Failed to get mod info for ID {mod_id}: {e}")
             raise
     
+    def invalidate_mod_info(self, mod_id: Optional[int] = None):
+        """Drop cached mod info for one mod, or for all mods if no ID is given"""
+        if mod_id is None:
+            self._mod_info_cache.clear()
+        else:
+            self._mod_info_cache.pop(mod_id, None)
+    
     def get_mod_files(self, mod_id: int, category: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get list of files for a mod with optional category filtering"""
         try:
@@ -211,8 +357,7 @@ class NexusModsClient:
             if category:
                 params["category"] = category
             
-            response = self._make_request("GET", endpoint, params=params)
-            files_data = response.json()
+            files_data = self._get_json(endpoint, params=params)
             
             # Extract files array from response
             files = files_data.get("files", []) if isinstance(files_data, dict) else files_data
@@ -226,11 +371,16 @@ class NexusModsClient:
             raise
     
     def get_file_info(self, mod_id: int, file_id: int) -> Dict[str, Any]:
-        """Get information about a specific file for a mod"""
+        """Get information about a specific file for a mod (cached for FILE_INFO_CACHE_TTL seconds)"""
+        cached = self._file_info_cache.get((mod_id, file_id))
+        if cached and time.monotonic() - cached[0] < self.FILE_INFO_CACHE_TTL:
+            logger.debug(f"Using cached file info for mod {mod_id}, file {file_id}")
+            return cached[1]
+        
         try:
             endpoint = f"/games/{self.GAME_DOMAIN}/mods/{mod_id}/files/{file_id}.json"
-            response = self._make_request("GET", endpoint)
-            file_data = response.json()
+            file_data = self._get_json(endpoint)
+            self._file_info_cache[(mod_id, file_id)] = (time.monotonic(), file_data)
             
             logger.info(f"Retrieved file info for mod {mod_id}, file {file_id}: {file_data.get('name', 'Unknown')}")
             return file_data
@@ -269,43 +419,145 @@ class NexusModsClient:
             logger.error(f"Failed to get download link for mod {mod_id}, file {file_id}: {e}")
             raise
     
-    def download_file(self, download_url: str, file_path: str, progress_callback: Optional[Callable[[int, int], None]] = None) -> None:
-        """Download a file from the given URL with progress tracking"""
+    @staticmethod
+    def _resume_validator(headers) -> Optional[str]:
+        """Return the validator to send as If-Range when resuming this response's body
+        
+        If-Range only accepts a strong ETag, so a weak one falls back to Last-Modified.
+        """
+        etag = headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            return etag
+        return headers.get("Last-Modified")
+    
+    @staticmethod
+    def _load_part_info(info_path: Path) -> Optional[Dict[str, Any]]:
+        """Load the validator and total size recorded for a partial download"""
         try:
-            file_path = Path(file_path)
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            logger.info(f"Starting download to {file_path}")
-            
-            # Use a separate session for downloads to avoid interfering with API requests
-            with requests.Session() as download_session:
-                download_session.headers.update({
-                    "User-Agent": "Stalker2ModManager/1.0"
-                })
+            with open(info_path, "r", encoding="utf-8") as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(info, dict) or not info.get("validator"):
+            return None
+        return info
+    
+    @staticmethod
+    def _parse_content_range(value: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+        """Return (first byte, complete length) from a "bytes first-last/length" header"""
+        match = re.fullmatch(r"bytes (\d+)-\d+/(\d+|\*)", (value or "").strip())
+        if not match:
+            return None, None
+        total = match.group(2)
+        return int(match.group(1)), (int(total) if total != "*" else None)
+    
+    def download_file(self, download_url: str, file_path: str, progress_callback: Optional[Callable[[int, int], None]] = None) -> int:
+        """Download a file from the given URL with progress tracking, returning the bytes written
+        
+        Data is written to a ".part" file that is renamed into place only once the download completes.
+        The server's validator (ETag or Last-Modified) and the file size are saved next to it in
+        ".part.json", so a partial file left by an interrupted download or a dropped connection is
+        resumed with Range + If-Range (up to MAX_RETRIES times) only while the server still has the
+        same file. A partial file that can't be verified this way is discarded and downloaded again.
+        """
+        file_path = Path(file_path)
+        part_path = file_path.with_name(file_path.name + ".part")
+        info_path = file_path.with_name(file_path.name + ".part.json")
+        
+        def discard_partial(reason: str):
+            logger.info(f"Discarding partial download {part_path}: {reason}")
+            part_path.unlink(missing_ok=True)
+            info_path.unlink(missing_ok=True)
+        
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Starting download to {file_path}")
+        
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                try:
+                    offset = part_path.stat().st_size
+                except FileNotFoundError:
+                    offset = 0
+                
+                part_info = self._load_part_info(info_path) if offset else None
+                if offset and part_info is None:
+                    # Without a validator the bytes can't be matched to the server's copy
+                    discard_partial("no saved validator")
+                    offset = 0
                 
-                response = download_session.get(download_url, stream=True, timeout=self.TIMEOUT)
-                response.raise_for_status()
+                headers = None
+                if offset:
+                    # If-Range makes the server send the whole file instead if it has changed
+                    headers = {"Range": f"bytes={offset}-", "If-Range": part_info["validator"]}
                 
-                total_size = int(response.headers.get("content-length", 0))
-                downloaded = 0
+                # Use the dedicated download session to avoid interfering with API requests
+                with self.download_session.get(download_url, stream=True, timeout=self.TIMEOUT,
+                                               headers=headers) as response:
+                    if response.status_code == 416:
+                        # The partial file can't be continued (e.g. it is stale); start over
+                        discard_partial("range not satisfiable")
+                        continue
+                    response.raise_for_status()
+                    
+                    content_length = int(response.headers.get("content-length", 0))
+                    
+                    if offset and response.status_code == 206:
+                        first_byte, total_size = self._parse_content_range(response.headers.get("Content-Range"))
+                        if total_size is None and content_length:
+                            total_size = offset + content_length
+                        expected_size = part_info.get("total_size")
+                        if first_byte != offset or (expected_size and total_size != expected_size):
+                            discard_partial("server sent a different range or file size")
+                            continue
+                        logger.info(f"Resuming download of {file_path} at {offset:,} bytes")
+                    else:
+                        # A fresh download, or the server sent the whole (possibly changed) file
+                        offset = 0
+                        total_size = content_length
+                        validator = self._resume_validator(response.headers)
+                        if validator:
+                            with open(info_path, "w", encoding="utf-8") as f:
+                                json.dump({"validator": validator, "total_size": total_size}, f)
+                        else:
+                            info_path.unlink(missing_ok=True)
+                    
+                    downloaded = offset
+                    
+                    report_progress = progress_callback is not None and total_size > 0
+                    
+                    with open(part_path, "ab" if offset else "wb") as f:
+                        for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                            if chunk:
+                                f.write(chunk)
+                                downloaded += len(chunk)
+                                
+                                if report_progress:
+                                    progress_callback(downloaded, total_size)
                 
-                with open(file_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            
-                            if progress_callback and total_size > 0:
-                                progress_callback(downloaded, total_size)
+                # Atomic on both POSIX and Windows, replacing any existing file of the same name
+                os.replace(part_path, file_path)
+                info_path.unlink(missing_ok=True)
                 
                 logger.info(f"Download completed: {file_path} ({downloaded:,} bytes)")
+                return downloaded
                 
-        except Exception as e:
-            logger.error(f"Download failed: {e}")
-            # Clean up partial download
-            if file_path.exists():
-                file_path.unlink()
-            raise NexusAPIError(f"Download failed: {e}")
+            except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError,
+                    requests.exceptions.Timeout) as e:
+                if attempt < self.MAX_RETRIES - 1:
+                    logger.warning(f"Download interrupted, resuming: {e}")
+                    continue
+                # Keep the partial file so a later download can resume it
+                logger.error(f"Download failed: {e}")
+                raise NexusAPIError(f"Download failed: {e}")
+            
+            except Exception as e:
+                logger.error(f"Download failed: {e}")
+                # Clean up partial download
+                part_path.unlink(missing_ok=True)
+                info_path.unlink(missing_ok=True)
+                raise NexusAPIError(f"Download failed: {e}")
+        
+        raise NexusAPIError(f"Download failed after {self.MAX_RETRIES} attempts")
     
     def get_latest_mod_version(self, mod_id: int) -> Optional[str]:
         """Get the latest version string for a mod"""
@@ -320,19 +572,19 @@ class NexusModsClient:
         try:
             files = self.get_mod_files(mod_id)
             
-            # Look for main files first
-            main_files = [f for f in files if f.get("category_name") == "MAIN"]
-            if main_files:
-                # Sort by upload time and get the latest
-                main_files.sort(key=lambda x: x.get("uploaded_time", 0), reverse=True)
-                return main_files[0].get("file_id")
-            
-            # Fallback to any file
-            if files:
-                files.sort(key=lambda x: x.get("uploaded_time", 0), reverse=True)
-                return files[0].get("file_id")
+            # Single pass: latest MAIN file, falling back to the latest file of any category.
+            # Avoids sorting, which would also reorder the cached file list in place
+            latest_main = latest_any = None
+            main_ts = any_ts = -1
+            for f in files:
+                ts = f.get("uploaded_timestamp", 0)
+                if ts > any_ts:
+                    any_ts, latest_any = ts, f
+                if ts > main_ts and f.get("category_name") == "MAIN":
+                    main_ts, latest_main = ts, f
             
-            return None
+            latest = latest_main or latest_any
+            return latest.get("file_id") if latest else None
             
         except NexusAPIError:
             return None
@@ -603,9 +855,23 @@ class NexusModsClient:
             logger.error(f"Failed to get colour schemes: {e}")
             raise
     
+    def save_http_cache(self):
+        """Write validators fetched this session to the persistent HTTP cache"""
+        if self.http_cache is None or not self._dirty_cache_keys:
+            return
+        dirty_keys, self._dirty_cache_keys = self._dirty_cache_keys, set()
+        try:
+            self.http_cache.save_entries({
+                key: self._validator_cache[key] for key in dirty_keys if key in self._validator_cache
+            })
+        except Exception as e:
+            logger.warning(f"Could not save HTTP cache: {e}")
+    
     def close(self):
-        """Close the session"""
+        """Save the HTTP cache and close the sessions"""
+        self.save_http_cache()
         self.session.close()
+        self.download_session.close()
         logger.info("Nexus Mods API client closed")
 
 
@@ -640,12 +906,20 @@ class ModDownloader:
         return filename
     
     def download_mod(self, mod_id: int, file_id: Optional[int] = None, 
-                    progress_callback: Optional[Callable[[int, int], None]] = None) -> str:
-        """Download a mod and return the file path"""
+                    progress_callback: Optional[Callable[[int, int], None]] = None,
+                    file_info: Optional[Dict[str, Any]] = None) -> str:
+        """Download a mod and return the file path (pass file_info to skip re-listing the mod's files)"""
         try:
             # Get mod information
             mod_info = self.nexus_client.get_mod_info(mod_id)
             
+            # Use the caller's file entry when it matches, saving a files lookup
+            if file_info is not None:
+                if file_id is None:
+                    file_id = file_info.get("file_id")
+                elif file_info.get("file_id") != file_id:
+                    file_info = None
+            
             # Get file ID if not provided
             if file_id is None:
                 file_id = self.nexus_client.get_main_file_id(mod_id)
@@ -653,12 +927,12 @@ class ModDownloader:
                     raise NexusAPIError(f"No downloadable files found for mod {mod_id}")
             
             # Get file information
-            files = self.nexus_client.get_mod_files(mod_id)
-            file_info = None
-            for f in files:
-                if f.get("file_id") == file_id:
-                    file_info = f
-                    break
+            if file_info is None:
+                files = self.nexus_client.get_mod_files(mod_id)
+                for f in files:
+                    if f.get("file_id") == file_id:
+                        file_info = f
+                        break
             
             if not file_info:
                 raise NexusAPIError(f"File {file_id} not found for mod {mod_id}")
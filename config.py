@@ -78,6 +78,7 @@ BACKUP_DIRECTORY = os.path.join(LOCAL_APP_DATA_DIR, "backups")
 NEXUS_GAME_DOMAIN = "stalker2heartofchornobyl"
 NEXUS_BASE_URL = "https://www.nexusmods.com"
 NEXUS_API_BASE = "https://api.nexusmods.com/v1"
+NEXUS_MAX_CONCURRENCY = 8  # Parallel API requests during update checks
 
 # File extensions
 SUPPORTED_ARCHIVE_EXTENSIONS = [".zip", ".rar", ".7z"]
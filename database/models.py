@@ -4,8 +4,10 @@ Database models and schema for Stalker 2 Mod Manager
 
 import sqlite3
 import os
+import json
 import logging
-from typing import Optional, List, Dict, Any
+import threading
+from typing import Optional, List, Dict, Any, Set, Tuple
 from contextlib import contextmanager
 from pathlib import Path
 import config
@@ -13,12 +15,35 @@ import config
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# UPDATE ... RETURNING needs SQLite 3.35+
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
 
 class DatabaseError(Exception):
     """Custom exception for database-related errors"""
     pass
 
 
+class _TransactionConnection:
+    """Connection proxy handed out inside DatabaseManager.transaction()
+    
+    Commits issued by individual manager methods are deferred so the whole
+    block is committed (or rolled back) once by the transaction itself.
+    """
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+    
+    def commit(self) -> None:
+        pass
+    
+    def rollback(self) -> None:
+        pass
+    
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
 class DatabaseManager:
     """Manages SQLite database operations"""
     
@@ -75,9 +100,30 @@ class DatabaseManager:
                 FOREIGN KEY (mod_id) REFERENCES mods (id) ON DELETE CASCADE,
                 UNIQUE(mod_id, source_path)
             )
+        """,
+        "http_cache": """
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body TEXT NOT NULL,
+                cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
         """
     }
     
+    # Indexes created alongside the schema
+    INDEXES = (
+        "CREATE INDEX IF NOT EXISTS idx_mods_nexus_id ON mods(nexus_mod_id)",
+        "CREATE INDEX IF NOT EXISTS idx_mods_enabled ON mods(enabled)",
+        "CREATE INDEX IF NOT EXISTS idx_mods_name_nocase ON mods(mod_name COLLATE NOCASE)",
+        "CREATE INDEX IF NOT EXISTS idx_archives_mod_id ON mod_archives(mod_id)",
+        "CREATE INDEX IF NOT EXISTS idx_archives_active ON mod_archives(is_active)",
+        "CREATE INDEX IF NOT EXISTS idx_selections_mod_id ON deployment_selections(mod_id)",
+        "CREATE INDEX IF NOT EXISTS idx_deployed_mod_id ON deployed_files(mod_id)",
+        "CREATE INDEX IF NOT EXISTS idx_deployed_path ON deployed_files(deployed_path)",
+    )
+    
     def __init__(self, db_path: str = None):
         """Initialize database manager with the specified database path"""
         if db_path is None:
@@ -87,6 +133,18 @@ class DatabaseManager:
         
         self.db_path = Path(db_path).resolve()
         
+        # Per-thread state: the long-lived connection reused by get_connection(),
+        # its nesting depth, and the connection of an active transaction() block
+        self._local = threading.local()
+        
+        # Stack of idle read-only connections used by execute_query
+        self._read_pool: List[sqlite3.Connection] = []
+        self._read_pool_lock = threading.Lock()
+        
+        # Every per-thread and pooled connection opened, so close() can reach
+        # connections owned by worker threads too
+        self._open_connections: set = set()
+        
         # Ensure the directory exists with proper error handling
         try:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -104,10 +162,12 @@ class DatabaseManager:
         """Create database and tables if they don't exist"""
         try:
             with self.get_connection() as conn:
-                # Enable foreign key constraints
-                conn.execute("PRAGMA foreign_keys = ON")
+                # WAL journal mode is persistent, so it only needs setting once per database
+                conn.execute("PRAGMA journal_mode = WAL")
                 
-                # Create all tables
+                # Create all tables and indexes in one transaction; DDL statements would
+                # otherwise each autocommit (and sync to disk) on a first launch
+                conn.execute("BEGIN")
                 for table_name, schema in self.SCHEMA.items():
                     logger.debug(f"Creating table: {table_name}")
                     conn.execute(schema)
@@ -155,41 +215,183 @@ class DatabaseManager:
     
     def _create_indexes(self, conn: sqlite3.Connection):
         """Create database indexes for better performance"""
-        indexes = [
-            "CREATE INDEX IF NOT EXISTS idx_mods_nexus_id ON mods(nexus_mod_id)",
-            "CREATE INDEX IF NOT EXISTS idx_mods_enabled ON mods(enabled)",
-            "CREATE INDEX IF NOT EXISTS idx_archives_mod_id ON mod_archives(mod_id)",
-            "CREATE INDEX IF NOT EXISTS idx_archives_active ON mod_archives(is_active)",
-            "CREATE INDEX IF NOT EXISTS idx_selections_mod_id ON deployment_selections(mod_id)",
-            "CREATE INDEX IF NOT EXISTS idx_deployed_mod_id ON deployed_files(mod_id)",
-            "CREATE INDEX IF NOT EXISTS idx_deployed_path ON deployed_files(deployed_path)"
-        ]
-        
-        for index in indexes:
+        for index in self.INDEXES:
             conn.execute(index)
     
+    # Per-connection tuning; WAL lets readers proceed while a writer commits,
+    # and synchronous=NORMAL is safe under WAL with one fsync per checkpoint
+    CONNECTION_PRAGMAS = (
+        "PRAGMA foreign_keys = ON",
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA busy_timeout = 5000",
+        "PRAGMA cache_size = -20000",
+    )
+    
+    # Idle read-only connections kept for execute_query; under WAL these read
+    # concurrently with each other and with the one active writer
+    READ_POOL_SIZE = 6
+    
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """Open a new configured connection to the database"""
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=check_same_thread)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        for pragma in self.CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def _open_tracked(self) -> sqlite3.Connection:
+        """Open a connection that close() will close, whichever thread calls it"""
+        conn = self._connect(check_same_thread=False)
+        with self._read_pool_lock:
+            self._open_connections.add(conn)
+        return conn
+    
+    @contextmanager
+    def _read_connection(self):
+        """Borrow a pooled read-only connection, shared across threads one borrower at a time"""
+        with self._read_pool_lock:
+            conn = self._read_pool.pop() if self._read_pool else None
+        if conn is None:
+            conn = self._open_tracked()
+            conn.execute("PRAGMA query_only = 1")
+        
+        try:
+            yield conn
+        finally:
+            # Hand back most-recently-used first so hot connections keep a warm page cache
+            with self._read_pool_lock:
+                if len(self._read_pool) < self.READ_POOL_SIZE:
+                    self._read_pool.append(conn)
+                    conn = None
+            if conn is not None:
+                with self._read_pool_lock:
+                    self._open_connections.discard(conn)
+                conn.close()
+    
     @contextmanager
     def get_connection(self):
         """Get a database connection with proper context management"""
-        conn = None
+        # Reuse the connection of an enclosing transaction() on this thread
+        transaction_conn = getattr(self._local, "conn", None)
+        if transaction_conn is not None:
+            try:
+                yield _TransactionConnection(transaction_conn)
+            except sqlite3.Error as e:
+                logger.error(f"Database error: {e}")
+                raise DatabaseError(f"Database operation failed: {e}")
+            return
+        
+        conn = self._thread_connection()
+        self._local.depth += 1
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row  # Enable column access by name
-            conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
             yield conn
         except sqlite3.Error as e:
-            if conn:
+            if self._local.depth == 1:
                 conn.rollback()
             logger.error(f"Database error: {e}")
             raise DatabaseError(f"Database operation failed: {e}")
         finally:
-            if conn:
+            self._local.depth -= 1
+            # Discard writes left uncommitted, as closing a per-call connection used to
+            if self._local.depth == 0 and conn.in_transaction:
+                conn.rollback()
+            self._release_thread_connection()
+    
+    def _thread_connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use
+        
+        Nested blocks on the thread share it, and the main thread keeps it between
+        calls to avoid paying the open and pragma setup on every query.
+        """
+        conn = getattr(self._local, "shared_conn", None)
+        if conn is None or conn not in self._open_connections:
+            conn = self._open_tracked()
+            self._local.shared_conn = conn
+            self._local.depth = 0
+        return conn
+    
+    def _release_thread_connection(self) -> None:
+        """Close a worker thread's connection once its outermost block has finished
+        
+        Background tasks each run on a fresh short-lived thread, so keeping their
+        connections would leak one per task until shutdown. Only the main (UI)
+        thread, which makes most calls, keeps its connection between calls.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return
+        if getattr(self._local, "conn", None) is not None or getattr(self._local, "depth", 0) > 0:
+            return
+        
+        conn = getattr(self._local, "shared_conn", None)
+        if conn is None:
+            return
+        self._local.shared_conn = None
+        with self._read_pool_lock:
+            self._open_connections.discard(conn)
+        try:
+            conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Error closing database connection: {e}")
+    
+    def close(self) -> None:
+        """Close every connection this manager opened
+        
+        Closing the last connection checkpoints the WAL into the database file and
+        removes the -wal/-shm files. Call at shutdown, once worker threads have
+        stopped using the database; a thread that uses it afterwards transparently
+        opens a new connection.
+        """
+        with self._read_pool_lock:
+            connections, self._open_connections = self._open_connections, set()
+            self._read_pool = []
+        
+        for conn in connections:
+            try:
                 conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Error closing database connection: {e}")
+        logger.info(f"Closed {len(connections)} database connections")
+    
+    @contextmanager
+    def transaction(self):
+        """Group several writes into a single transaction (BEGIN IMMEDIATE / COMMIT)
+        
+        Manager calls made on this thread inside the block share one connection
+        and are committed together, or rolled back together on any exception.
+        Nested transaction() blocks join the outer one.
+        """
+        if getattr(self._local, "conn", None) is not None:
+            yield
+            return
+        
+        # Run on this thread's reused connection rather than opening a new one
+        try:
+            conn = self._thread_connection()
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.Error as e:
+            self._release_thread_connection()
+            logger.error(f"Failed to begin transaction: {e}")
+            raise DatabaseError(f"Failed to begin transaction: {e}")
+        
+        self._local.conn = conn
+        try:
+            yield
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            self._release_thread_connection()
     
     def execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """Execute a SELECT query and return results as list of dictionaries"""
+        # Inside a transaction() or get_connection() block this thread may have
+        # uncommitted writes, which only its own connection can see
+        in_write = getattr(self._local, "conn", None) is not None or getattr(self._local, "depth", 0) > 0
         try:
-            with self.get_connection() as conn:
+            with (self.get_connection() if in_write else self._read_connection()) as conn:
                 cursor = conn.execute(query, params)
                 rows = cursor.fetchall()
                 # Convert Row objects to dictionaries
@@ -320,6 +522,22 @@ class ConfigManager:
             logger.error(f"Failed to set config '{key}': {e}")
             raise
     
+    def set_many(self, values: Dict[str, str]) -> None:
+        """Set several configuration values in a single transaction"""
+        if not values:
+            return
+        try:
+            with self.db.get_connection() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)",
+                    list(values.items())
+                )
+                conn.commit()
+            logger.debug(f"Set {len(values)} config values: {', '.join(values)}")
+        except DatabaseError as e:
+            logger.error(f"Failed to set config values: {e}")
+            raise
+    
     def get_all_config(self) -> Dict[str, str]:
         """Get all configuration values"""
         try:
@@ -425,6 +643,17 @@ class ConfigManager:
     def set_test_archive_integrity(self, enabled: bool) -> None:
         """Set archive integrity testing setting"""
         self.set_config("test_archive_integrity", "true" if enabled else "false")
+    
+    def get_has_nexus_mods(self) -> Optional[bool]:
+        """Get cached flag for whether any installed mod comes from Nexus (None if never computed)"""
+        value = self.get_config("has_nexus_mods")
+        if value is None:
+            return None
+        return value.lower() == "true"
+    
+    def set_has_nexus_mods(self, has_nexus_mods: bool) -> None:
+        """Set cached flag for whether any installed mod comes from Nexus"""
+        self.set_config("has_nexus_mods", "true" if has_nexus_mods else "false")
 
 
 class ModManager:
@@ -493,7 +722,7 @@ class ModManager:
         """Get all mods"""
         try:
             return self.db.execute_query(
-                "SELECT * FROM mods ORDER BY mod_name"
+                "SELECT * FROM mods ORDER BY mod_name COLLATE NOCASE"
             )
         except DatabaseError as e:
             logger.error(f"Failed to get all mods: {e}")
@@ -503,7 +732,7 @@ class ModManager:
         """Get all enabled mods"""
         try:
             return self.db.execute_query(
-                "SELECT * FROM mods WHERE enabled = 1 ORDER BY mod_name"
+                "SELECT * FROM mods WHERE enabled = 1 ORDER BY mod_name COLLATE NOCASE"
             )
         except DatabaseError as e:
             logger.error(f"Failed to get enabled mods: {e}")
@@ -513,7 +742,7 @@ class ModManager:
         """Get all disabled mods"""
         try:
             return self.db.execute_query(
-                "SELECT * FROM mods WHERE enabled = 0 ORDER BY mod_name"
+                "SELECT * FROM mods WHERE enabled = 0 ORDER BY mod_name COLLATE NOCASE"
             )
         except DatabaseError as e:
             logger.error(f"Failed to get disabled mods: {e}")
@@ -588,24 +817,102 @@ class ModManager:
             logger.error(f"Failed to remove mod {mod_id}: {e}")
             raise
     
-    def set_mod_enabled(self, mod_id: int, enabled: bool) -> None:
-        """Set mod enabled/disabled status"""
+    def remove_mods(self, mod_ids: List[int]) -> int:
+        """Remove several mods and their related data in one transaction, returning the number removed"""
         try:
-            affected = self.db.execute_command(
-                "UPDATE mods SET enabled = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                (enabled, mod_id)
-            )
+            with self.db.get_connection() as conn:
+                cursor = conn.executemany(
+                    "DELETE FROM mods WHERE id = ?",
+                    [(mod_id,) for mod_id in mod_ids]
+                )
+                conn.commit()
+                logger.info(f"Removed {cursor.rowcount} of {len(mod_ids)} mods")
+                return cursor.rowcount
+                
+        except DatabaseError as e:
+            logger.error(f"Failed to remove {len(mod_ids)} mods: {e}")
+            raise
+    
+    def set_mod_enabled(self, mod_id: int, enabled: bool) -> Optional[Dict[str, Any]]:
+        """Set mod enabled/disabled status, returning the updated mod row (None if not found)"""
+        try:
+            with self.db.get_connection() as conn:
+                if _SQLITE_HAS_RETURNING:
+                    rows = conn.execute(
+                        "UPDATE mods SET enabled = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ? RETURNING *",
+                        (enabled, mod_id)
+                    ).fetchall()
+                else:
+                    conn.execute(
+                        "UPDATE mods SET enabled = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                        (enabled, mod_id)
+                    )
+                    rows = conn.execute("SELECT * FROM mods WHERE id = ?", (mod_id,)).fetchall()
+                conn.commit()
             
-            if affected > 0:
+            if rows:
                 status = "enabled" if enabled else "disabled"
                 logger.info(f"Mod {mod_id} {status}")
-            else:
-                logger.warning(f"No mod found with ID {mod_id}")
+                return dict(rows[0])
+            
+            logger.warning(f"No mod found with ID {mod_id}")
+            return None
                 
         except DatabaseError as e:
             logger.error(f"Failed to set mod {mod_id} enabled status: {e}")
             raise
     
+    def bulk_set_enabled(self, mod_ids: List[int], enabled: bool) -> int:
+        """Set enabled/disabled status for several mods in one transaction"""
+        if not mod_ids:
+            return 0
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.executemany(
+                    "UPDATE mods SET enabled = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                    [(enabled, mod_id) for mod_id in mod_ids]
+                )
+                conn.commit()
+                
+                status = "enabled" if enabled else "disabled"
+                logger.info(f"{cursor.rowcount} mods {status}")
+                return cursor.rowcount
+                
+        except DatabaseError as e:
+            logger.error(f"Failed to set enabled status for {len(mod_ids)} mods: {e}")
+            raise
+    
+    def exists_by_name(self, mod_name: str) -> bool:
+        """Check whether a mod with the given name exists (case-insensitive)"""
+        try:
+            results = self.db.execute_query(
+                "SELECT 1 FROM mods WHERE mod_name = ? COLLATE NOCASE LIMIT 1",
+                (mod_name,)
+            )
+            return bool(results)
+        except DatabaseError as e:
+            logger.error(f"Failed to check for mod named '{mod_name}': {e}")
+            raise
+    
+    def has_any_mods(self) -> bool:
+        """Check whether any mod exists without loading the mod rows"""
+        try:
+            return bool(self.db.execute_query("SELECT 1 FROM mods LIMIT 1"))
+        except DatabaseError as e:
+            logger.error(f"Failed to check for mods: {e}")
+            return False
+    
+    def has_nexus_mods(self) -> bool:
+        """Check whether any mod has a Nexus Mods ID"""
+        try:
+            results = self.db.execute_query(
+                "SELECT 1 FROM mods WHERE nexus_mod_id IS NOT NULL LIMIT 1"
+            )
+            return bool(results)
+        except DatabaseError as e:
+            logger.error(f"Failed to check for Nexus mods: {e}")
+            return False
+    
     def search_mods(self, search_term: str) -> List[Dict[str, Any]]:
         """Search mods by name or author"""
         try:
@@ -661,15 +968,17 @@ class ArchiveManager:
                    file_size: Optional[int] = None, set_active: bool = True) -> int:
         """Add a new mod archive"""
         try:
-            # If this should be the active archive, deactivate others first
-            if set_active:
-                self.db.execute_command(
-                    "UPDATE mod_archives SET is_active = 0 WHERE mod_id = ?",
-                    (mod_id,)
-                )
-            
-            # Insert the new archive
+            # Both statements share one connection and commit, so they are applied
+            # together (or joined into the caller's transaction())
             with self.db.get_connection() as conn:
+                # If this should be the active archive, deactivate others first
+                if set_active:
+                    conn.execute(
+                        "UPDATE mod_archives SET is_active = 0 WHERE mod_id = ?",
+                        (mod_id,)
+                    )
+                
+                # Insert the new archive
                 cursor = conn.execute("""
                     INSERT INTO mod_archives (mod_id, version, file_name, is_active, file_size)
                     VALUES (?, ?, ?, ?, ?)
@@ -677,9 +986,9 @@ class ArchiveManager:
                 
                 archive_id = cursor.lastrowid
                 conn.commit()
-                
-                logger.info(f"Added archive '{file_name}' for mod {mod_id}")
-                return archive_id
+            
+            logger.info(f"Added archive '{file_name}' for mod {mod_id}")
+            return archive_id
                 
         except sqlite3.Error as e:
             logger.error(f"Failed to add archive: {e}")
@@ -720,6 +1029,25 @@ class ArchiveManager:
             logger.error(f"Failed to get archives for mod {mod_id}: {e}")
             return []
     
+    def get_archives_for_mods(self, mod_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """Get archives for several mods at once, keyed by mod ID"""
+        archives: Dict[int, List[Dict[str, Any]]] = {}
+        try:
+            # Chunk to stay under SQLite's bound-parameter limit
+            for start in range(0, len(mod_ids), 500):
+                chunk = mod_ids[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                results = self.db.execute_query(
+                    f"SELECT * FROM mod_archives WHERE mod_id IN ({placeholders}) ORDER BY download_date DESC",
+                    tuple(chunk)
+                )
+                for row in results:
+                    archives.setdefault(row["mod_id"], []).append(row)
+            return archives
+        except DatabaseError as e:
+            logger.error(f"Failed to get archives for {len(mod_ids)} mods: {e}")
+            return archives
+    
     def set_active_archive(self, mod_id: int, archive_id: int) -> None:
         """Set which archive is active for a mod"""
         try:
@@ -850,11 +1178,10 @@ class DeploymentManager:
                 )
                 
                 # Insert new selections
-                for file_path in selected_files:
-                    conn.execute(
-                        "INSERT INTO deployment_selections (mod_id, archive_path) VALUES (?, ?)",
-                        (mod_id, file_path)
-                    )
+                conn.executemany(
+                    "INSERT INTO deployment_selections (mod_id, archive_path) VALUES (?, ?)",
+                    [(mod_id, file_path) for file_path in selected_files]
+                )
                 
                 conn.commit()
                 logger.info(f"Saved {len(selected_files)} deployment selections for mod {mod_id}")
@@ -875,6 +1202,55 @@ class DeploymentManager:
             logger.error(f"Failed to get deployment selections for mod {mod_id}: {e}")
             return []
     
+    def has_selections(self, mod_id: int) -> bool:
+        """Check whether any files are selected for deployment for a mod"""
+        try:
+            results = self.db.execute_query(
+                "SELECT 1 FROM deployment_selections WHERE mod_id = ? LIMIT 1",
+                (mod_id,)
+            )
+            return bool(results)
+        except DatabaseError as e:
+            logger.error(f"Failed to check deployment selections for mod {mod_id}: {e}")
+            return False
+    
+    def get_selections_for_mods(self, mod_ids: List[int]) -> Dict[int, List[str]]:
+        """Get the selected files for several mods at once, keyed by mod ID"""
+        selections: Dict[int, List[str]] = {}
+        try:
+            # Chunk to stay under SQLite's bound-parameter limit
+            for start in range(0, len(mod_ids), 500):
+                chunk = mod_ids[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                results = self.db.execute_query(
+                    f"SELECT mod_id, archive_path FROM deployment_selections WHERE mod_id IN ({placeholders}) ORDER BY archive_path",
+                    tuple(chunk)
+                )
+                for row in results:
+                    selections.setdefault(row["mod_id"], []).append(row["archive_path"])
+            return selections
+        except DatabaseError as e:
+            logger.error(f"Failed to get deployment selections for {len(mod_ids)} mods: {e}")
+            return selections
+    
+    def mods_with_selections(self, mod_ids: List[int]) -> Set[int]:
+        """Get the subset of the given mod IDs that have deployment selections"""
+        configured = set()
+        try:
+            # Chunk to stay under SQLite's bound-parameter limit
+            for start in range(0, len(mod_ids), 500):
+                chunk = mod_ids[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                results = self.db.execute_query(
+                    f"SELECT DISTINCT mod_id FROM deployment_selections WHERE mod_id IN ({placeholders})",
+                    tuple(chunk)
+                )
+                configured.update(row["mod_id"] for row in results)
+            return configured
+        except DatabaseError as e:
+            logger.error(f"Failed to get deployment selections for {len(mod_ids)} mods: {e}")
+            return configured
+    
     def add_deployment_selection(self, mod_id: int, archive_path: str) -> None:
         """Add a single deployment selection"""
         try:
@@ -927,6 +1303,24 @@ class DeploymentManager:
             logger.error(f"Failed to record deployed file: {e}")
             raise
     
+    def add_deployed_files(self, rows: List[Tuple[int, str, str, Optional[str]]]) -> None:
+        """Record several (mod_id, source_path, deployed_path, original_backup_path) rows in one transaction"""
+        if not rows:
+            return
+        try:
+            with self.db.get_connection() as conn:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO deployed_files 
+                    (mod_id, source_path, deployed_path, original_backup_path, deployed_at)
+                    VALUES (?, ?, ?, ?, datetime('now'))
+                """, rows)
+                conn.commit()
+            
+            logger.debug(f"Recorded {len(rows)} deployed files")
+        except DatabaseError as e:
+            logger.error(f"Failed to record {len(rows)} deployed files: {e}")
+            raise
+    
     def remove_deployed_file(self, mod_id: int, source_path: str, deployed_path: str) -> Optional[Dict[str, Any]]:
         """Remove a deployed file record and return its info"""
         try:
@@ -1115,4 +1509,55 @@ class DeploymentManager:
             
         except DatabaseError as e:
             logger.error(f"Failed to get deployment statistics: {e}")
-            return {}
\ No newline at end of file
+            return {}
+
+
+class HttpCacheManager:
+    """Persists Nexus API response validators (ETag/Last-Modified) and bodies between sessions"""
+    
+    def __init__(self, db_manager: DatabaseManager):
+        self.db = db_manager
+    
+    def load_entries(self, max_age_seconds: Optional[int] = None) -> Dict[str, Tuple[Optional[str], Optional[str], Any]]:
+        """Load cached responses as {url: (etag, last_modified, body)}, dropping expired ones"""
+        try:
+            if max_age_seconds is not None:
+                with self.db.get_connection() as conn:
+                    conn.execute(
+                        "DELETE FROM http_cache WHERE cached_at < datetime('now', ?)",
+                        (f"-{int(max_age_seconds)} seconds",)
+                    )
+                    conn.commit()
+            
+            rows = self.db.execute_query("SELECT url, etag, last_modified, body FROM http_cache")
+            entries = {}
+            for row in rows:
+                try:
+                    entries[row["url"]] = (row["etag"], row["last_modified"], json.loads(row["body"]))
+                except ValueError:
+                    logger.warning(f"Skipping unreadable HTTP cache entry for {row['url']}")
+            return entries
+            
+        except DatabaseError as e:
+            logger.error(f"Failed to load HTTP cache: {e}")
+            return {}
+    
+    def save_entries(self, entries: Dict[str, Tuple[Optional[str], Optional[str], Any]]) -> None:
+        """Store {url: (etag, last_modified, body)} entries in one transaction"""
+        if not entries:
+            return
+        try:
+            rows = [
+                (url, etag, last_modified, json.dumps(body))
+                for url, (etag, last_modified, body) in entries.items()
+            ]
+            with self.db.get_connection() as conn:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body, cached_at)
+                    VALUES (?, ?, ?, ?, datetime('now'))
+                """, rows)
+                conn.commit()
+            
+            logger.debug(f"Saved {len(rows)} HTTP cache entries")
+        except (DatabaseError, TypeError, ValueError) as e:
+            logger.error(f"Failed to save HTTP cache: {e}")
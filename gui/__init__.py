@@ -1,3 +1,29 @@
 """
 GUI Package for Stalker 2 Mod Manager
-"""
\ No newline at end of file
+"""
+
+import importlib
+
+# Dialog classes re-exported from the package, each imported only when first accessed
+# (PEP 562) so loading gui.main_window does not pull in gui.dialogs
+_LAZY_EXPORTS = {
+    "AddModDialog": "gui.dialogs",
+    "SettingsDialog": "gui.dialogs",
+    "DeploymentSelectionDialog": "gui.dialogs",
+    "ShutdownConfirmationDialog": "gui.dialogs",
+    "TaskMonitorDialog": "gui.dialogs",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
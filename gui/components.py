@@ -23,6 +23,9 @@ class ModListFrame:
         self.mod_manager = mod_manager
         self.selected_mod = None
         
+        # Tree item ID of each mod row currently shown, keyed by mod ID
+        self._row_cache = {}
+        
         self.setup_ui()
         self.load_mod_data()
     
@@ -35,16 +38,8 @@ class ModListFrame:
                 self.mod_data = {mod["id"]: mod for mod in all_mods}
                 
                 # Convert database format to display format
-                for mod_id, mod in self.mod_data.items():
-                    mod["name"] = mod["mod_name"]  # Add name alias
-                    mod["version"] = mod.get("latest_version", "Unknown")  # Add version alias
-                    mod["last_updated"] = mod.get("updated_at", mod.get("created_at", "Unknown"))[:10] if mod.get("updated_at") else "Unknown"
-                    
-                    # Determine status
-                    if mod["enabled"]:
-                        mod["status"] = "enabled"
-                    else:
-                        mod["status"] = "disabled"
+                for mod in self.mod_data.values():
+                    self._add_display_fields(mod)
                 
                 logger.info(f"Loaded {len(self.mod_data)} mods from database")
                 
@@ -57,6 +52,20 @@ class ModListFrame:
         
         self.refresh_list()
     
+    @staticmethod
+    def _add_display_fields(mod):
+        """Add the display aliases and status used by the list to a database mod row"""
+        mod["name"] = mod["mod_name"]  # Add name alias
+        mod["version"] = mod.get("latest_version", "Unknown")  # Add version alias
+        mod["last_updated"] = mod.get("updated_at", mod.get("created_at", "Unknown"))[:10] if mod.get("updated_at") else "Unknown"
+        
+        # Determine status
+        if mod["enabled"]:
+            mod["status"] = "enabled"
+        else:
+            mod["status"] = "disabled"
+        return mod
+    
     def setup_ui(self):
         """Setup the mod list UI"""
         try:
@@ -207,6 +216,7 @@ class ModListFrame:
             # Clear existing items
             for item in self.tree.get_children():
                 self.tree.delete(item)
+            self._row_cache.clear()
             
             # Check if we have any mods
             if not self.mod_data:
@@ -247,33 +257,57 @@ class ModListFrame:
     def _populate_tree(self, filtered_mods):
         """Populate the tree with mod data"""
         for mod in filtered_mods:
-            status_text = mod["status"]
-            
-            # Check for updates available (this would need archive manager integration)
-            # For now, just show the basic status
-            
-            # Determine tag based on status
-            tags = []
-            if mod["enabled"]:
-                tags.append("enabled")
-            else:
-                tags.append("disabled")
-            
-            # Note: Update checking would require archive manager integration
-            # if mod.get("latest_version") and mod["version"] != mod["latest_version"]:
-            #     tags.append("outdated")
-            #     status_text = f"outdated ({mod['latest_version']} available)"
-            
+            values, tags = self._row_values(mod)
             item_id = self.tree.insert(
                 "",
                 "end",
                 text=mod["name"],
-                values=(mod.get("version", "Unknown"), status_text, mod.get("last_updated", "Unknown")),
+                values=values,
                 tags=tags
             )
-            
-            # Store mod data for easy retrieval
-            self.tree.item(item_id, tags=tags + [f"mod_id_{mod['id']}"])
+            self._row_cache[mod["id"]] = item_id
+    
+    @staticmethod
+    def _row_values(mod):
+        """Return the tree column values and tags for a mod row"""
+        status_text = mod["status"]
+        
+        # Check for updates available (this would need archive manager integration)
+        # For now, just show the basic status
+        
+        # Determine tag based on status
+        tags = []
+        if mod["enabled"]:
+            tags.append("enabled")
+        else:
+            tags.append("disabled")
+        
+        # Note: Update checking would require archive manager integration
+        # if mod.get("latest_version") and mod["version"] != mod["latest_version"]:
+        #     tags.append("outdated")
+        #     status_text = f"outdated ({mod['latest_version']} available)"
+        
+        # Store mod ID in the tags for easy retrieval
+        tags.append(f"mod_id_{mod['id']}")
+        
+        values = (mod.get("version", "Unknown"), status_text, mod.get("last_updated", "Unknown"))
+        return values, tags
+    
+    def update_row(self, mod_id, mod_data):
+        """Re-render a single mod's row in place, falling back to a full refresh
+        when the change moves the mod in or out of the current filter"""
+        mod = self._add_display_fields(dict(mod_data))
+        self.mod_data[mod_id] = mod
+        if self.selected_mod and self.selected_mod.get("id") == mod_id:
+            self.selected_mod = mod
+        
+        item_id = self._row_cache.get(mod_id)
+        if item_id is not None and any(m["id"] == mod_id for m in self.get_filtered_mods()):
+            values, tags = self._row_values(mod)
+            self.tree.item(item_id, values=values, tags=tags)
+        else:
+            self.refresh_list()
+        return mod
     
     def show_empty_state(self):
         """Show empty state when no mods are installed"""
@@ -384,24 +418,25 @@ class ModListFrame:
         return self.selected_mod
     
     def update_mod_status(self, mod_id, enabled):
-        """Update the enabled status of a mod"""
+        """Update the enabled status of a mod, returning the updated mod (None on failure)"""
         if self.mod_manager:
             try:
-                self.mod_manager.set_mod_enabled(mod_id, enabled)
-                # Reload data to reflect changes
-                self.load_mod_data()
-                return True
+                updated_mod = self.mod_manager.set_mod_enabled(mod_id, enabled)
+                if updated_mod is None:
+                    return None
+                # Only the changed row needs re-rendering
+                return self.update_row(mod_id, updated_mod)
             except Exception as e:
                 logger.error(f"Error updating mod status: {e}")
-                return False
+                return None
         else:
             # Fallback to local data update
             if mod_id in self.mod_data:
                 self.mod_data[mod_id]["enabled"] = enabled
                 self.mod_data[mod_id]["status"] = "enabled" if enabled else "disabled"
                 self.refresh_list()
-                return True
-            return False
+                return self.mod_data[mod_id]
+            return None
 
 
 class ModDetailsFrame:
@@ -1085,8 +1120,16 @@ class ModDetailsFrame:
 class StatusBar:
     """Status bar for showing application status"""
     
+    # Minimum interval between status text repaints
+    STATUS_COALESCE_MS = 50
+    
     def __init__(self, parent):
         self.parent = parent
+        
+        # Latest message waiting for the coalescing timer, and that timer's after() id
+        self._status_pending = None
+        self._status_after = None
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -1124,8 +1167,27 @@ class StatusBar:
         connection_label.pack(side=RIGHT, padx=(0, 5))
     
     def set_status(self, message):
-        """Set the status message"""
+        """Set the status message
+        
+        The first message is shown immediately; messages arriving within the next
+        STATUS_COALESCE_MS are coalesced so only the latest of them is drawn.
+        """
+        if self._status_after is not None:
+            self._status_pending = message
+            return
+        
+        self.status_var.set(message)
+        self._status_after = self.status_frame.after(self.STATUS_COALESCE_MS, self._flush_status)
+    
+    def _flush_status(self):
+        """Show the latest coalesced status message, if any arrived"""
+        message, self._status_pending = self._status_pending, None
+        if message is None:
+            self._status_after = None
+            return
+        
         self.status_var.set(message)
+        self._status_after = self.status_frame.after(self.STATUS_COALESCE_MS, self._flush_status)
     
     def show_progress(self, show=True):
         """Show or hide the progress bar"""
@@ -1683,7 +1683,8 @@ class ShutdownConfirmationDialog:
             "deploy": "🚀",
             "update_mod": "⬆️",
             "api_validation": "🔑",
-            "rate_limit_check": "⏱️"
+            "rate_limit_check": "⏱️",
+            "cleanup": "🧹"
         }
         
         icon = type_icons.get(task.task_type.value, "⚙️")
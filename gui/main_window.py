@@ -4,52 +4,352 @@ Main Window for Stalker 2 Mod Manager
 
 from pathlib import Path
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import messagebox
 import ttkbootstrap as ttk_bootstrap
 from ttkbootstrap.constants import *
-from gui.dialogs import AddModDialog, SettingsDialog, DeploymentSelectionDialog, ShutdownConfirmationDialog, TaskMonitorDialog
 from gui.components import ModListFrame, ModDetailsFrame, StatusBar
 from utils.logging_config import get_logger
+from utils.thread_manager import get_thread_manager, TaskType
+import config as app_config
 import os
+import shutil
+import threading
 import time
+import functools
+import importlib
+from operator import attrgetter
+import queue
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+# Modules imported at first use rather than at module load. The first group is needed
+# by _on_db_ready, the second by the first dialog opened; both are imported on the
+# DatabaseInit thread so the UI thread finds them already in sys.modules
+_STARTUP_IMPORTS = ("api.nexus_api", "utils.file_manager")
+_PREWARM_IMPORTS = ("gui.dialogs",)
+
+
+# ttkbootstrap converts the same handful of theme colors with winfo_rgb for every
+# styled widget, and each call is a Tk round trip; the result only depends on the color
+_tk_winfo_rgb = getattr(tk.Misc.winfo_rgb, "__wrapped__", tk.Misc.winfo_rgb)
+_rgb_cache = {}
+
+
+def _cached_winfo_rgb(self, color):
+    """tk.Misc.winfo_rgb memoized by color"""
+    rgb = _rgb_cache.get(color)
+    if rgb is None:
+        rgb = _rgb_cache[color] = _tk_winfo_rgb(self, color)
+    return rgb
+
+
+_cached_winfo_rgb.__wrapped__ = _tk_winfo_rgb
+
+# Patch only once, so a re-import doesn't stack wrappers around the original
+if not hasattr(tk.Misc.winfo_rgb, "__wrapped__"):
+    tk.Misc.winfo_rgb = _cached_winfo_rgb
+
+
+def _requires_database(handler):
+    """Make a UI command report startup progress instead of running before the database is ready"""
+    @functools.wraps(handler)
+    def wrapper(self, *args, **kwargs):
+        if not self._db_ready:
+            if self._db_error is not None:
+                self.status_bar.set_status("Database unavailable")
+            else:
+                self.status_bar.set_status("Still initializing, please wait...")
+            return None
+        return handler(self, *args, **kwargs)
+    return wrapper
+
+
+def _select_latest_file(files):
+    """Pick the most recently uploaded MAIN file, falling back to the latest file of any category"""
+    latest_main = latest_any = None
+    main_ts = any_ts = -1
+    for f in files:
+        ts = f.get('uploaded_timestamp', 0)
+        if ts > any_ts:
+            any_ts, latest_any = ts, f
+        if ts > main_ts and f.get('category_name') == 'MAIN':
+            main_ts, latest_main = ts, f
+    return latest_main or latest_any
+
+
+_NUMERIC_VERSION_RE = re.compile(r'v?(\d+(?:\.\d+)*)', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_version(version):
+    """Parse a dotted numeric version into a comparable tuple, or None if it isn't one"""
+    match = _NUMERIC_VERSION_RE.fullmatch((version or '0').strip())
+    if not match:
+        return None
+    parts = [int(p) for p in match.group(1).split('.')]
+    # "1.10" and "1.10.0" are the same release
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+def _is_newer_version(latest, current):
+    """Check whether latest is newer than current, falling back to inequality for free-form versions"""
+    latest_parsed = _parse_version(latest)
+    current_parsed = _parse_version(current)
+    if latest_parsed is None or current_parsed is None:
+        return latest != current
+    return latest_parsed > current_parsed
+
+
+# Keyboard shortcuts shown in the shortcuts dialog, by category
+_SHORTCUTS_DATA = {
+    "File Operations": [
+        ("Ctrl+O", "Add Mod from URL"),
+        ("Ctrl+Shift+O", "Add Mod from File"),
+        ("Delete", "Remove Selected Mod")
+    ],
+    "Mod Management": [
+        ("F5", "Check for Updates"),
+        ("Ctrl+U", "Update All Mods"),
+        ("Ctrl+D", "Deploy Changes"),
+        ("Ctrl+Shift+E", "Enable All Mods"),
+        ("Ctrl+Shift+D", "Disable All Mods")
+    ],
+    "Navigation": [
+        ("Ctrl+S", "Open Settings"),
+        ("F1", "Show About Dialog")
+    ]
+}
+
+_ABOUT_TEXT = (
+    "Stalker 2 Mod Manager v1.0\n\n"
+    "A lightweight mod manager for Stalker 2: Heart of Chornobyl\n\n"
+    "Features:\n"
+    "• Download mods from Nexus Mods\n"
+    "• Install mods from local files\n"
+    "• Selective file deployment\n"
+    "• Automatic update checking\n"
+    "• Enable/disable mods easily"
+)
+
+# Keyboard shortcuts: (event sequence, MainWindow handler name); handlers take event=None
+_KEY_BINDINGS = (
+    ('<Control-o>', "add_mod_from_url"),
+    ('<Control-Shift-O>', "add_mod_from_file"),
+    ('<F5>', "check_for_updates"),
+    ('<Control-u>', "update_all_mods"),
+    ('<Control-d>', "deploy_changes"),
+    ('<Delete>', "remove_selected_mod"),
+    ('<Control-s>', "open_settings"),
+    ('<F1>', "show_about"),
+    ('<Control-Shift-E>', "enable_all_mods"),
+    ('<Control-Shift-D>', "disable_all_mods"),
+)
+
+# Toolbar buttons, left to right: (label, MainWindow handler name, ttk style name,
+# attribute to store the button under or None, initial state); None is a separator.
+# Buttons name their ttkbootstrap theme styles directly rather than going through
+# bootstyle= keyword parsing for each widget
+_TOOLBAR_SPEC = (
+    ("Add from URL", "add_mod_from_url", "primary.TButton", None, NORMAL),
+    ("Add from File", "add_mod_from_file", "secondary.TButton", None, NORMAL),
+    None,
+    ("Enable Mod", "enable_selected_mod", "success.TButton", "enable_button", DISABLED),
+    ("Disable Mod", "disable_selected_mod", "warning.TButton", "disable_button", DISABLED),
+    None,
+    ("Deploy Changes", "deploy_changes", "info.TButton", "deploy_button", NORMAL),
+    ("Check Updates", "check_for_updates", "info.TButton", None, NORMAL),
+    ("Update All", "update_all_mods", "success.TButton", None, NORMAL),
+)
+
+# Menu bar layout: (menu label, ((item label, MainWindow attribute path), ...)); None is a separator
+_MENU_SPEC = (
+    ("File", (
+        ("Add Mod from URL...", "add_mod_from_url"),
+        ("Add Mod from File...", "add_mod_from_file"),
+        None,
+        ("Settings...", "open_settings"),
+        None,
+        ("Exit", "root.quit"),
+    )),
+    ("Edit", (
+        ("Enable Selected Mod", "enable_selected_mod"),
+        ("Disable Selected Mod", "disable_selected_mod"),
+        None,
+        ("Enable All Mods", "enable_all_mods"),
+        ("Disable All Mods", "disable_all_mods"),
+        None,
+        ("Configure File Deployment...", "configure_file_deployment"),
+        None,
+        ("Remove Mod", "remove_selected_mod"),
+    )),
+    ("Tools", (
+        ("Check for Updates", "check_for_updates"),
+        ("Update All Mods", "update_all_mods"),
+        ("Deploy Changes", "deploy_changes"),
+        None,
+        ("Task Monitor", "show_task_monitor"),
+        None,
+        ("Open Game Directory", "open_game_directory"),
+        ("Open Mods Directory", "open_mods_directory"),
+    )),
+    ("Help", (
+        ("Keyboard Shortcuts", "show_shortcuts"),
+        None,
+        ("About", "show_about"),
+    )),
+)
+
 
 class MainWindow:
     """Main application window"""
     
+    # How long a successful API key validation is trusted
+    API_VALIDATION_TTL_SECONDS = 24 * 3600
+    
+    # Concurrent archive downloads during "Update All"
+    BULK_DOWNLOAD_WORKERS = 3
+    
+    # How long "Update All" trusts the result of the last update check
+    UPDATE_CHECK_REUSE_SECONDS = 120
+    
+    # Quiet period before the details panel follows the list selection
+    SELECTION_DEBOUNCE_MS = 120
+    
     def __init__(self, root):
         self.root = root
         
-        # Initialize database components
-        from database.models import DatabaseManager, ConfigManager, ModManager, ArchiveManager, DeploymentManager
-        import config as app_config
-        
-        # Ensure app directories exist
-        app_config.ensure_directories()
+        # Database managers are created off the UI thread by _init_db_background
+        self.db_manager = None
+        self.config_manager = None
+        self.mod_manager = None
+        self.archive_manager = None
+        self.deployment_manager = None
+        self.http_cache_manager = None
         
-        # Initialize database
-        self.db_manager = DatabaseManager(app_config.DEFAULT_DATABASE_PATH)
-        self.config_manager = ConfigManager(self.db_manager)
-        self.mod_manager = ModManager(self.db_manager)
-        self.archive_manager = ArchiveManager(self.db_manager)
-        self.deployment_manager = DeploymentManager(self.db_manager)
+        # Set once _on_db_ready has wired the managers into the UI, or the error if that failed
+        self._db_ready = False
+        self._db_error = None
         
         # Initialize Nexus API client and file manager
         self.nexus_client = None
         self.file_manager = None
         
+        # Shared pool for archive validation/security scans so they run in
+        # parallel with each other and across concurrent installs
+        self._scan_pool = ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1),
+            thread_name_prefix="ArchiveScan"
+        )
+        
+        # Single worker for deleting superseded archives off the update path
+        self._cleanup_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ArchiveCleanup")
+        
+        # Long-lived pool for per-mod Nexus lookups, so each update check reuses
+        # warm worker threads instead of spinning up a fresh executor
+        self._nexus_pool = ThreadPoolExecutor(
+            max_workers=app_config.NEXUS_MAX_CONCURRENCY,
+            thread_name_prefix="NexusCheck"
+        )
+        
+        # Pending after() ids used to coalesce refresh/layout requests
+        self._refresh_pending = None
+        self._layout_pending = None
+        self._select_pending = None
+        
+        # Last applied (enable, disable) toolbar button states, and whether the details
+        # panel has content, so repeated selections skip no-op Tk reconfiguration
+        self._toggle_button_states = (DISABLED, DISABLED)
+        self._details_shown = False
+        
+        # Progress/status updates from worker threads, applied by one coalescing drain callback
+        self._status_queue = queue.Queue()
+        self._status_drain_pending = False
+        # Last percent posted, per worker thread: each background task runs on its own
+        # thread, so concurrent downloads, checks and deploys don't suppress each other
+        self._progress_local = threading.local()
+        
+        # Mod dict for the current list selection, kept in sync by on_mod_selected
+        self._selected_mod = None
+        
+        # Monotonic time of the last successful API validation in this session
+        self._api_validated_at = None
+        
+        # Shortcuts dialog, built on first use and hidden rather than destroyed
+        self._shortcuts_dialog = None
+        
+        # Result of the last update check: {'ts': monotonic time, 'updates_available': [...]}
+        self._last_update_check = None
+        
+        # Task factory for API key validation (startup and manual)
+        self._validate_task_factory = functools.partial(
+            get_thread_manager().create_task,
+            task_type=TaskType.API_VALIDATION
+        )
+        
         self.setup_menu()
         self.setup_main_ui()
         self.setup_bindings()
         
-        # Auto-detect game path on first run if not set
-        self.auto_detect_game_path_if_needed()
-
-        # Initialize basic configuration if needed (no sample data)
-        self.init_basic_config_if_needed()
+        # Open the database and run first-run setup without holding up the first paint;
+        # _on_db_ready finishes startup on the main thread
+        threading.Thread(target=self._init_db_background, name="DatabaseInit", daemon=True).start()
+    
+    def _init_db_background(self):
+        """Create the database managers and run first-run setup (worker thread)"""
+        try:
+            from database.models import DatabaseManager, ConfigManager, ModManager, ArchiveManager, DeploymentManager, HttpCacheManager
+            
+            # Ensure app directories exist
+            app_config.ensure_directories()
+            
+            # Initialize database
+            db_manager = DatabaseManager(app_config.DEFAULT_DATABASE_PATH)
+            self.config_manager = ConfigManager(db_manager)
+            self.mod_manager = ModManager(db_manager)
+            self.archive_manager = ArchiveManager(db_manager)
+            self.deployment_manager = DeploymentManager(db_manager)
+            self.http_cache_manager = HttpCacheManager(db_manager)
+            self.db_manager = db_manager
+            
+            # Auto-detect game path on first run if not set
+            self.auto_detect_game_path_if_needed()
+            
+            # Initialize basic configuration if needed (no sample data)
+            self.init_basic_config_if_needed()
+        except Exception as e:
+            logger.exception("Failed to initialize the database")
+            self.root.after(0, self._on_db_failed, e)
+            return
+        
+        self._prewarm_imports(_STARTUP_IMPORTS)
+        self.root.after(0, self._on_db_ready)
+        self._prewarm_imports(_PREWARM_IMPORTS)
+    
+    def _prewarm_imports(self, module_names):
+        """Import deferred modules ahead of first use (worker thread)"""
+        for module_name in module_names:
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                # The real import at first use will report the problem
+                logger.debug(f"Could not prewarm {module_name}: {e}")
+    
+    def _on_db_ready(self):
+        """Finish startup once the database is available (main thread)"""
+        self._db_ready = True
+        
+        if self.mod_details_frame:
+            self.mod_details_frame.deployment_manager = self.deployment_manager
+            self.mod_details_frame.config_manager = self.config_manager
+        
+        # Populate the mod list
+        self.mod_list_frame.mod_manager = self.mod_manager
+        self.mod_list_frame.load_mod_data()
         
         # Initialize API components after UI is ready
         self.init_api_components()
@@ -57,12 +357,17 @@ class MainWindow:
         # Check for updates on startup if enabled
         self.check_updates_on_startup()
     
+    def _on_db_failed(self, error):
+        """Report a database that could not be opened (main thread)"""
+        self._db_error = error
+        self.status_bar.set_status("Database unavailable")
+        messagebox.showerror("Database Error", f"Could not open the mod database:\n\n{error}")
+    
     def init_api_components(self):
         """Initialize API client and file manager based on current settings"""
         try:
             # Initialize file manager
             from utils.file_manager import FileManager
-            import config as app_config
             self.file_manager = FileManager(
                 game_path=self.config_manager.get_game_path() or "",
                 mods_path=self.config_manager.get_mods_directory() or app_config.DEFAULT_MODS_DIR,
@@ -72,8 +377,11 @@ class MainWindow:
             # Initialize Nexus API client if API key is available
             api_key = self.config_manager.get_api_key()
             if api_key:
-                from api.nexus_api import NexusModsClient
-                self.nexus_client = NexusModsClient(api_key)
+                # Keep the existing client, and its warm connection pool and caches,
+                # unless the key changed
+                if not self.nexus_client or self.nexus_client.api_key != api_key:
+                    from api.nexus_api import NexusModsClient
+                    self.nexus_client = NexusModsClient(api_key, http_cache=self.http_cache_manager)
                 
                 # Check if we have stored user info from previous validation
                 api_user = self.config_manager.get_config('api_user_name')
@@ -98,16 +406,22 @@ class MainWindow:
         if not self.nexus_client:
             return
         
-        # Check if we recently validated the API key (within the last 24 hours)
+        # Already validated during this session; monotonic time is immune to clock changes
+        if (self._api_validated_at is not None and
+                time.monotonic() - self._api_validated_at < self.API_VALIDATION_TTL_SECONDS):
+            logger.info("API key already validated this session, skipping startup validation")
+            return
+        
+        # Check if we recently validated the API key (within the last 24 hours).
+        # The persisted timestamp is wall-clock epoch, so compare against time.time()
         last_validated = self.config_manager.get_config('api_last_validated')
         if last_validated:
             try:
-                last_validated_time = int(last_validated)
-                current_time = int(time.time())
-                hours_since_last_validation = (current_time - last_validated_time) / 3600
+                seconds_since_last_validation = time.time() - int(last_validated)
+                hours_since_last_validation = seconds_since_last_validation / 3600
                 
                 # If validated within the last 24 hours, skip validation
-                if hours_since_last_validation < 24:
+                if 0 <= seconds_since_last_validation < self.API_VALIDATION_TTL_SECONDS:
                     logger.info(f"API key was validated {hours_since_last_validation:.1f} hours ago, skipping startup validation")
                     return
             except (ValueError, TypeError):
@@ -127,10 +441,7 @@ class MainWindow:
                 self.root.after(0, self._update_startup_validation_error, str(e))
         
         # Create background task for validation
-        from utils.thread_manager import get_thread_manager, TaskType
-        thread_manager = get_thread_manager()
-        task_id = thread_manager.create_task(
-            task_type=TaskType.API_VALIDATION,
+        task_id = self._validate_task_factory(
             description="Validating Nexus Mods API key on startup",
             target=validate_thread,
             can_cancel=False  # Don't allow cancelling startup validation
@@ -158,6 +469,7 @@ class MainWindow:
             except Exception as e:
                 logger.error(f"Failed to save API user info: {e}")
             
+            self._api_validated_at = time.monotonic()
             logger.info(f"API key validated successfully on startup for user: {username} (ID: {user_id})")
             
         except Exception as e:
@@ -180,6 +492,7 @@ class MainWindow:
         
         # Set nexus_client to None since the API key is invalid
         self.nexus_client = None
+        self._api_validated_at = None
         
         logger.error(f"API key validation failed on startup: {error_message}")
     
@@ -193,7 +506,7 @@ class MainWindow:
         if not self.nexus_client:
             try:
                 from api.nexus_api import NexusModsClient
-                self.nexus_client = NexusModsClient(api_key)
+                self.nexus_client = NexusModsClient(api_key, http_cache=self.http_cache_manager)
             except Exception as e:
                 logger.error(f"Failed to create API client: {e}")
                 self.status_bar.set_status("Failed to create API client")
@@ -209,10 +522,7 @@ class MainWindow:
                 self.root.after(0, self._update_manual_validation_error, str(e))
         
         # Create background task for validation
-        from utils.thread_manager import get_thread_manager, TaskType
-        thread_manager = get_thread_manager()
-        task_id = thread_manager.create_task(
-            task_type=TaskType.API_VALIDATION,
+        task_id = self._validate_task_factory(
             description="Manually validating Nexus Mods API key",
             target=validate_thread,
             can_cancel=True
@@ -241,6 +551,7 @@ class MainWindow:
             except Exception as e:
                 logger.error(f"Failed to save API user info: {e}")
             
+            self._api_validated_at = time.monotonic()
             logger.info(f"Manual API key validation successful for user: {username} (ID: {user_id})")
             
         except Exception as e:
@@ -263,6 +574,7 @@ class MainWindow:
         
         # Set nexus_client to None since the API key is invalid
         self.nexus_client = None
+        self._api_validated_at = None
         
         logger.error(f"Manual API key validation failed: {error_message}")
     
@@ -279,11 +591,14 @@ class MainWindow:
                 logger.info("No API key configured, skipping startup update check")
                 return
             
-            # Check if there are any mods to update
-            all_mods = self.mod_manager.get_all_mods()
-            nexus_mods = [mod for mod in all_mods if mod.get('nexus_mod_id')]
+            # Check if there are any mods to update using the cached flag,
+            # computing it once for databases created before the flag existed
+            has_nexus_mods = self.config_manager.get_has_nexus_mods()
+            if has_nexus_mods is None:
+                has_nexus_mods = self.mod_manager.has_nexus_mods()
+                self.config_manager.set_has_nexus_mods(has_nexus_mods)
             
-            if not nexus_mods:
+            if not has_nexus_mods:
                 logger.info("No Nexus mods found, skipping startup update check")
                 return
             
@@ -318,25 +633,19 @@ class MainWindow:
             
             logger.info("Initializing basic configuration for first run...")
             
-            # Import config for accessing constants
-            import config as app_config
-            
-            # Set only essential configuration
-            # Set auto_check_updates to True by default, but don't override user's choice
-            if self.config_manager.get_auto_check_updates() is None:
-                self.config_manager.set_auto_check_updates(True)
-            self.config_manager.set_update_interval(app_config.DEFAULT_UPDATE_INTERVAL_HOURS)
-            
-            # Set default mod storage directory
-            self.config_manager.set_mods_directory(app_config.DEFAULT_MODS_DIR)
+            # Set only essential configuration, in one write. The config table is empty
+            # here, so there is no earlier auto-update choice to preserve
+            self.config_manager.set_many({
+                "auto_check_updates": "true",
+                "update_interval_hours": str(app_config.DEFAULT_UPDATE_INTERVAL_HOURS),
+                "mods_directory": app_config.DEFAULT_MODS_DIR,
+            })
             logger.info(f"Set default mod storage directory: {app_config.DEFAULT_MODS_DIR}")
             
             logger.info("Basic configuration initialized successfully")
             
-        except Exception as e:
-            logger.error(f"Error initializing basic configuration: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error initializing basic configuration")
     
     def auto_detect_game_path_if_needed(self):
         """Auto-detect game path on first run or if not currently set"""
@@ -384,47 +693,21 @@ class MainWindow:
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
         
-        # File Menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="Add Mod from URL...", command=self.add_mod_from_url)
-        file_menu.add_command(label="Add Mod from File...", command=self.add_mod_from_file)
-        file_menu.add_separator()
-        file_menu.add_command(label="Settings...", command=self.open_settings)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
-        
-        # Edit Menu
-        edit_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Edit", menu=edit_menu)
-        edit_menu.add_command(label="Enable Selected Mod", command=self.enable_selected_mod)
-        edit_menu.add_command(label="Disable Selected Mod", command=self.disable_selected_mod)
-        edit_menu.add_separator()
-        edit_menu.add_command(label="Enable All Mods", command=self.enable_all_mods)
-        edit_menu.add_command(label="Disable All Mods", command=self.disable_all_mods)
-        edit_menu.add_separator()
-        edit_menu.add_command(label="Configure File Deployment...", command=self.configure_file_deployment)
-        edit_menu.add_separator()
-        edit_menu.add_command(label="Remove Mod", command=self.remove_selected_mod)
-        
-        # Tools Menu
-        tools_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Tools", menu=tools_menu)
-        tools_menu.add_command(label="Check for Updates", command=self.check_for_updates)
-        tools_menu.add_command(label="Update All Mods", command=self.update_all_mods)
-        tools_menu.add_command(label="Deploy Changes", command=self.deploy_changes)
-        tools_menu.add_separator()
-        tools_menu.add_command(label="Task Monitor", command=self.show_task_monitor)
-        tools_menu.add_separator()
-        tools_menu.add_command(label="Open Game Directory", command=self.open_game_directory)
-        tools_menu.add_command(label="Open Mods Directory", command=self.open_mods_directory)
-        
-        # Help Menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="Keyboard Shortcuts", command=self.show_shortcuts)
-        help_menu.add_separator()
-        help_menu.add_command(label="About", command=self.show_about)
+        # Cascades start empty and are filled the first time they are posted
+        for menu_label, items in _MENU_SPEC:
+            menu = tk.Menu(menubar, tearoff=0)
+            menu.configure(postcommand=functools.partial(self._populate_menu, menu, items))
+            menubar.add_cascade(label=menu_label, menu=menu)
+    
+    def _populate_menu(self, menu, items):
+        """Add a cascade's entries on first open, then drop the postcommand hook"""
+        menu.configure(postcommand="")
+        for item in items:
+            if item is None:
+                menu.add_separator()
+            else:
+                label, command = item
+                menu.add_command(label=label, command=attrgetter(command)(self))
     
     def setup_main_ui(self):
         """Setup the main UI layout"""
@@ -447,114 +730,70 @@ class MainWindow:
         right_frame = ttk_bootstrap.Frame(paned_window)
         paned_window.add(right_frame, weight=1)
         
-        # Create mod list frame
-        self.mod_list_frame = ModListFrame(left_frame, self.on_mod_selected, self.mod_manager)
-        
-        # Create mod details frame
-        self.mod_details_frame = ModDetailsFrame(right_frame, self.on_mod_action, self.deployment_manager, self.config_manager)
+        # Mod details frame is only built once there is something to show in it
+        # (a selection, or the "no mods" state), keeping it off the startup path
+        self._details_parent = right_frame
+        self.mod_details_frame = None
         
-        # Check if we need to set the "no mods available" state
-        if not self.mod_list_frame.mod_data:
-            self.mod_details_frame.set_no_mods_state()
+        # Create mod list frame (populated once the database is ready)
+        self.mod_list_frame = ModListFrame(left_frame, self.on_mod_selected, self.mod_manager)
         
         # Create status bar
         self.status_bar = StatusBar(self.root)
         
-        # Set initial paned window position
-        self.root.after(200, lambda: paned_window.sashpos(0, 600))
+        # Set initial paned window position once the pane is mapped and has its geometry
+        def set_initial_sash(event):
+            paned_window.sashpos(0, 600)
+            paned_window.unbind('<Map>', map_binding)
+        map_binding = paned_window.bind('<Map>', set_initial_sash)
+        
         # Force layout update after a short delay to ensure proper rendering
-        self.root.after(50, self._ensure_ui_layout)
+        self._schedule_ui_layout(50)
+    
+    def _ensure_mod_details_frame(self):
+        """Return the mod details frame, creating it on first use"""
+        if self.mod_details_frame is None:
+            self.mod_details_frame = ModDetailsFrame(
+                self._details_parent, self.on_mod_action, self.deployment_manager, self.config_manager
+            )
+        return self.mod_details_frame
     
     def create_toolbar(self, parent):
         """Create the toolbar with main action buttons"""
         toolbar_frame = ttk_bootstrap.Frame(parent)
         toolbar_frame.pack(fill=X, pady=(0, 5))
         
-        # Add mod buttons
-        ttk_bootstrap.Button(
-            toolbar_frame, 
-            text="Add from URL", 
-            command=self.add_mod_from_url,
-            bootstyle=PRIMARY
-        ).pack(side=LEFT, padx=(0, 5))
-        
-        ttk_bootstrap.Button(
-            toolbar_frame, 
-            text="Add from File", 
-            command=self.add_mod_from_file,
-            bootstyle=SECONDARY
-        ).pack(side=LEFT, padx=(0, 5))
-        
-        # Separator
-        ttk_bootstrap.Separator(toolbar_frame, orient=VERTICAL).pack(side=LEFT, fill=Y, padx=10)
-        
-        # Enable/Disable buttons
-        self.enable_button = ttk_bootstrap.Button(
-            toolbar_frame, 
-            text="Enable Mod", 
-            command=self.enable_selected_mod,
-            bootstyle=SUCCESS,
-            state=DISABLED
-        )
-        self.enable_button.pack(side=LEFT, padx=(0, 5))
-        
-        self.disable_button = ttk_bootstrap.Button(
-            toolbar_frame, 
-            text="Disable Mod", 
-            command=self.disable_selected_mod,
-            bootstyle=WARNING,
-            state=DISABLED
-        )
-        self.disable_button.pack(side=LEFT, padx=(0, 5))
-        
-        # Separator
-        ttk_bootstrap.Separator(toolbar_frame, orient=VERTICAL).pack(side=LEFT, fill=Y, padx=10)
-        
-        # Deploy changes button
-        self.deploy_button = ttk_bootstrap.Button(
-            toolbar_frame, 
-            text="Deploy Changes", 
-            command=self.deploy_changes,
-            bootstyle=INFO
-        )
-        self.deploy_button.pack(side=LEFT, padx=(0, 5))
-        
-        # Update check button
-        ttk_bootstrap.Button(
-            toolbar_frame,
-            text="Check Updates",
-            command=self.check_for_updates,
-            bootstyle=INFO
-        ).pack(side=LEFT, padx=(0, 5))
-        
-        ttk_bootstrap.Button(
-            toolbar_frame,
-            text="Update All",
-            command=self.update_all_mods,
-            bootstyle=SUCCESS
-        ).pack(side=LEFT, padx=(0, 5))
+        for item in _TOOLBAR_SPEC:
+            if item is None:
+                ttk_bootstrap.Separator(toolbar_frame, orient=VERTICAL).pack(side=LEFT, fill=Y, padx=10)
+                continue
+            
+            label, handler, style, attribute, state = item
+            button = ttk_bootstrap.Button(
+                toolbar_frame,
+                text=label,
+                command=getattr(self, handler),
+                style=style,
+                state=state
+            )
+            button.pack(side=LEFT, padx=(0, 5))
+            if attribute:
+                setattr(self, attribute, button)
         
         # Settings button on the right
         ttk_bootstrap.Button(
             toolbar_frame, 
             text="Settings", 
             command=self.open_settings,
-            bootstyle=SECONDARY
+            style="secondary.TButton"
         ).pack(side=RIGHT)
     
     def setup_bindings(self):
         """Setup keyboard shortcuts and event bindings"""
-        # Keyboard shortcuts
-        self.root.bind('<Control-o>', lambda e: self.add_mod_from_url())
-        self.root.bind('<Control-Shift-O>', lambda e: self.add_mod_from_file())
-        self.root.bind('<F5>', lambda e: self.check_for_updates())
-        self.root.bind('<Control-u>', lambda e: self.update_all_mods())
-        self.root.bind('<Control-d>', lambda e: self.deploy_changes())
-        self.root.bind('<Delete>', lambda e: self.remove_selected_mod())
-        self.root.bind('<Control-s>', lambda e: self.open_settings())
-        self.root.bind('<F1>', lambda e: self.show_about())
-        self.root.bind('<Control-Shift-E>', lambda e: self.enable_all_mods())
-        self.root.bind('<Control-Shift-D>', lambda e: self.disable_all_mods())
+        # Keyboard shortcuts; bound on the main toplevel, which already sees key events
+        # from every child widget, but not from dialogs as bind_all would
+        for sequence, handler in _KEY_BINDINGS:
+            self.root.bind(sequence, getattr(self, handler))
         
         # Window close event
         self.root.protocol("WM_DELETE_WINDOW", self.close_application)
@@ -565,30 +804,54 @@ class MainWindow:
     
     def on_mod_selected(self, mod_data):
         """Handle mod selection from the list"""
+        self._selected_mod = mod_data if mod_data and mod_data != "NO_MODS_AVAILABLE" else None
+        
+        # Only repaint for the last of a burst of selection changes (e.g. arrow-key repeat)
+        if self._select_pending:
+            self.root.after_cancel(self._select_pending)
+        self._select_pending = self.root.after(
+            self.SELECTION_DEBOUNCE_MS, self._apply_mod_selection, mod_data
+        )
+    
+    def _apply_mod_selection(self, mod_data):
+        """Update the buttons and details panel for a (debounced) list selection"""
+        self._select_pending = None
+        
         # Check for special case when no mods are available
         if mod_data == "NO_MODS_AVAILABLE":
             # Update button states - all disabled
-            self.enable_button.config(state=DISABLED)
-            self.disable_button.config(state=DISABLED)
+            self._set_toggle_button_states(DISABLED, DISABLED)
             
-            # Update mod details panel to show "no mods available" state (if it exists yet)
-            if hasattr(self, 'mod_details_frame'):
-                self.mod_details_frame.set_no_mods_state()
+            # Show the "no mods available" state once the database has actually been read
+            if self.mod_manager is not None:
+                self._ensure_mod_details_frame().set_no_mods_state()
+                self._details_shown = True
             return
         
         # Update button states
         if mod_data:
-            self.enable_button.config(state=NORMAL if not mod_data.get('enabled') else DISABLED)
-            self.disable_button.config(state=NORMAL if mod_data.get('enabled') else DISABLED)
+            self._set_toggle_button_states(
+                NORMAL if not mod_data.get('enabled') else DISABLED,
+                NORMAL if mod_data.get('enabled') else DISABLED
+            )
             
             # Update mod details panel
-            if hasattr(self, 'mod_details_frame'):
-                self.mod_details_frame.display_mod(mod_data)
+            self._ensure_mod_details_frame().display_mod(mod_data)
+            self._details_shown = True
         else:
-            self.enable_button.config(state=DISABLED)
-            self.disable_button.config(state=DISABLED)
-            if hasattr(self, 'mod_details_frame'):
+            self._set_toggle_button_states(DISABLED, DISABLED)
+            if self.mod_details_frame and self._details_shown:
                 self.mod_details_frame.clear_display()
+                self._details_shown = False
+    
+    def _set_toggle_button_states(self, enable_state, disable_state):
+        """Set the Enable/Disable Mod button states, skipping buttons already in that state"""
+        old_enable, old_disable = self._toggle_button_states
+        if enable_state != old_enable:
+            self.enable_button.config(state=enable_state)
+        if disable_state != old_disable:
+            self.disable_button.config(state=disable_state)
+        self._toggle_button_states = (enable_state, disable_state)
     
     def on_mod_action(self, action, mod_data):
         """Handle actions from the mod details panel"""
@@ -635,8 +898,10 @@ class MainWindow:
             return None
     
     # Menu and toolbar action handlers
-    def add_mod_from_url(self):
+    @_requires_database
+    def add_mod_from_url(self, event=None):
         """Show dialog to add mod from Nexus URL"""
+        from gui import AddModDialog
         dialog = AddModDialog(self, mode="url") 
         result = dialog.show()
         if result:
@@ -645,8 +910,6 @@ class MainWindow:
     def download_mod_from_url(self, dialog_result):
         """Download and install mod from Nexus URL"""
         from api.nexus_api import NexusAPIError, ModDownloader
-        from utils.thread_manager import get_thread_manager, TaskType
-        import config as app_config
         
         url = dialog_result['url']
         auto_enable = dialog_result['auto_enable']
@@ -672,7 +935,7 @@ class MainWindow:
             def download_thread():
                 try:
                     # Update status
-                    self.root.after(0, lambda: self.status_bar.set_status("Fetching mod information..."))
+                    self.root.after(0, self.status_bar.set_status, "Fetching mod information...")
                     
                     # Get mod information from API
                     mod_info = self.nexus_client.get_mod_info(mod_id)
@@ -680,49 +943,51 @@ class MainWindow:
                     # Check if mod already exists
                     existing_mod = self.mod_manager.get_mod_by_nexus_id(mod_id)
                     if existing_mod:
-                        self.root.after(0, lambda: self.status_bar.set_status(
+                        self.root.after(
+                            0, self.status_bar.set_status,
                             f"Mod '{mod_info['name']}' is already installed. Use 'Check Updates' to update."
-                        ))
+                        )
                         return
                     
                     # Initialize file_id variable
                     current_file_id = file_id
+                    file_size = None
+                    latest_file = None
                     
                     # Get latest file if no specific file was requested
                     if not current_file_id:
-                        self.root.after(0, lambda: self.status_bar.set_status("Finding latest mod file..."))
+                        self.root.after(0, self.status_bar.set_status, "Finding latest mod file...")
                         files = self.nexus_client.get_mod_files(mod_id)
-                        main_files = [f for f in files if f.get('category_name') == 'MAIN']
-                        if not main_files:
-                            main_files = files  # Fall back to any file
                         
-                        if not main_files:
-                            self.root.after(0, lambda: messagebox.showerror(
-                                "No Files", 
+                        # Get the most recent file (MAIN preferred)
+                        latest_file = _select_latest_file(files)
+                        if not latest_file:
+                            self.root.after(
+                                0, messagebox.showerror,
+                                "No Files",
                                 f"No downloadable files found for mod '{mod_info['name']}'."
-                            ))
+                            )
                             return
                         
-                        # Get the most recent file
-                        latest_file = max(main_files, key=lambda f: f.get('uploaded_timestamp', 0))
                         current_file_id = latest_file['file_id']
+                        if latest_file.get('size_kb'):
+                            file_size = latest_file['size_kb'] * 1024
+                    
+                    # Create progress callback; only whole-percent changes reach the Tk queue
+                    status_prefix = f"Downloading {mod_info['name']}..."
                     
-                    # Create progress callback
                     def progress_callback(downloaded, total):
                         if total > 0:
                             percent = int((downloaded / total) * 100)
-                            self.root.after(0, lambda: self.status_bar.set_progress(percent))
-                            self.root.after(0, lambda: self.status_bar.set_status(
-                                f"Downloading {mod_info['name']}... {percent}%"
-                            ))
+                            self._post_progress_status(percent, f"{status_prefix} {percent}%")
                     
                     # Download the mod
-                    self.root.after(0, lambda: self.status_bar.set_status(f"Downloading {mod_info['name']}..."))
+                    self.root.after(0, self.status_bar.set_status, status_prefix)
                     downloader = ModDownloader(self.nexus_client, app_config.DEFAULT_MODS_DIR)
-                    archive_path = downloader.download_mod(mod_id, current_file_id, progress_callback)
+                    archive_path = downloader.download_mod(mod_id, current_file_id, progress_callback, file_info=latest_file)
                     
                     # Add mod to database
-                    self.root.after(0, lambda: self.status_bar.set_status("Adding mod to database..."))
+                    self.root.after(0, self.status_bar.set_status, "Adding mod to database...")
                     mod_data = {
                         "nexus_mod_id": mod_id,
                         "mod_name": mod_info['name'],
@@ -732,24 +997,30 @@ class MainWindow:
                         "enabled": auto_enable
                     }
                     
-                    new_mod_id = self.mod_manager.add_mod(mod_data)
-                    
-                    # Add archive record
                     # Use the actual filename that was generated and used for download
                     actual_filename = Path(archive_path).name
-                    file_info = self.nexus_client.get_file_info(mod_id, current_file_id)
-                    self.archive_manager.add_archive(
-                        mod_id=new_mod_id,
-                        version=mod_info.get('version', '1.0.0'),
-                        file_name=actual_filename,  # Use the actual downloaded filename
-                        file_size=file_info.get('size_kb', 0) * 1024 if file_info.get('size_kb') else None
-                        # TODO: Store nexus_file_id in a separate field if needed
-                    )
+                    if file_size is None:
+                        # Specific file requested, so use the size of what was downloaded
+                        file_size = os.path.getsize(archive_path)
+                    
+                    # Add mod and archive record in a single transaction
+                    with self.db_manager.transaction():
+                        new_mod_id = self.mod_manager.add_mod(mod_data)
+                        self.archive_manager.add_archive(
+                            mod_id=new_mod_id,
+                            version=mod_info.get('version', '1.0.0'),
+                            file_name=actual_filename,  # Use the actual downloaded filename
+                            file_size=file_size
+                            # TODO: Store nexus_file_id in a separate field if needed
+                        )
+                    self.config_manager.set_has_nexus_mods(True)
+                    # A cached update check wouldn't include the new mod
+                    self._last_update_check = None
                     
                     # Refresh the UI on main thread
                     self.root.after(0, self.refresh_mod_list)
-                    self.root.after(0, lambda: self.status_bar.set_progress(0))
-                    self.root.after(0, lambda: self.status_bar.set_status(f"Successfully added mod: {mod_info['name']}"))
+                    self.root.after(0, self.status_bar.set_progress, 0)
+                    self.root.after(0, self.status_bar.set_status, f"Successfully added mod: {mod_info['name']}")
                     
                     # Show success message
                     message = f"Successfully added mod '{mod_info['name']}'"
@@ -757,7 +1028,7 @@ class MainWindow:
                         message += " and enabled it"
                     message += "."
                     
-                    self.root.after(0, lambda: self.status_bar.set_status(message))
+                    self.root.after(0, self.status_bar.set_status, message)
                     
                 except NexusAPIError as e:
                     error_msg = f"Nexus API Error: {e}"
@@ -766,16 +1037,16 @@ class MainWindow:
                     elif e.status_code == 404:
                         error_msg = "Mod not found. Please check the URL."
                     
-                    self.root.after(0, lambda: messagebox.showerror("API Error", error_msg))
-                    self.root.after(0, lambda: self.status_bar.set_status(f"Error: {error_msg}"))
+                    self.root.after(0, messagebox.showerror, "API Error", error_msg)
+                    self.root.after(0, self.status_bar.set_status, f"Error: {error_msg}")
                     
                 except Exception as e:
                     error_msg = f"Error downloading mod: {e}"
-                    self.root.after(0, lambda: messagebox.showerror("Download Error", error_msg))
-                    self.root.after(0, lambda: self.status_bar.set_status(error_msg))
+                    self.root.after(0, messagebox.showerror, "Download Error", error_msg)
+                    self.root.after(0, self.status_bar.set_status, error_msg)
                     
                 finally:
-                    self.root.after(0, lambda: self.status_bar.set_progress(0))
+                    self.root.after(0, self.status_bar.set_progress, 0)
             
             # Create task using thread manager
             thread_manager = get_thread_manager()
@@ -792,8 +1063,10 @@ class MainWindow:
             messagebox.showerror("Error", f"Error processing URL: {e}")
             self.status_bar.set_status(f"Error: {e}")
     
-    def add_mod_from_file(self):
+    @_requires_database
+    def add_mod_from_file(self, event=None):
         """Show dialog to add mod from local file"""
+        from gui import AddModDialog
         dialog = AddModDialog(self, mode="file")
         result = dialog.show()
         if result:
@@ -801,16 +1074,15 @@ class MainWindow:
     
     def install_mod_from_file(self, dialog_result):
         """Install mod from local archive file"""
-        from utils.thread_manager import get_thread_manager, TaskType
-        import os
-        from pathlib import Path
-        import config as app_config
-
         file_path = dialog_result['file_path']
         auto_enable = dialog_result['auto_enable']
         mod_info = dialog_result.get('mod_info', {})
 
-        self.status_bar.set_status(f"Processing file: {os.path.basename(file_path)}")
+        # Parse the source path once
+        src = Path(file_path)
+        src_name, src_stem, src_suffix = src.name, src.stem, src.suffix
+
+        self.status_bar.set_status(f"Processing file: {src_name}")
 
         if not self.file_manager:
             messagebox.showerror("Error", "File manager not initialized. Please check your configuration.")
@@ -818,18 +1090,22 @@ class MainWindow:
 
         def install_thread():
             try:
-                # Validate the archive
-                self.root.after(0, lambda: self.status_bar.set_status("Validating archive..."))
+                # Validate the archive and scan it for security issues concurrently
+                self.root.after(0, self.status_bar.set_status, "Validating archive...")
+                validate_future = self._scan_pool.submit(self.file_manager.validate_archive, file_path)
+                security_future = self._scan_pool.submit(self.file_manager.scan_archive_security, file_path)
 
-                if not self.file_manager.validate_archive(file_path):
-                    self.root.after(0, lambda: messagebox.showerror(
+                if not validate_future.result():
+                    security_future.cancel()
+                    self.root.after(
+                        0, messagebox.showerror,
                         "Invalid Archive",
                         "The selected file is not a valid archive or may be corrupted."
-                    ))
+                    )
                     return
 
                 # Check for security issues
-                security_result = self.file_manager.scan_archive_security(file_path)
+                security_result = security_future.result()
                 if not security_result['safe']:
                     warnings = "\n".join(security_result['warnings'])
                     response = messagebox.askyesno(
@@ -843,68 +1119,77 @@ class MainWindow:
                 if mod_info.get('mod_name'):
                     mod_name = mod_info['mod_name']
                 else:
-                    file_name = Path(file_path).stem
-                    mod_name = file_name.replace('_', ' ').replace('-', ' ').title()
+                    mod_name = src_stem.replace('_', ' ').replace('-', ' ').title()
 
                 # Check if mod with same name already exists
-                existing_mods = self.mod_manager.get_all_mods()
-                for mod in existing_mods:
-                    if mod['mod_name'].lower() == mod_name.lower():
-                        self.root.after(0, lambda: messagebox.showwarning(
-                            "Mod Already Exists",
-                            f"A mod with the name '{mod_name}' already exists.\n\nPlease rename the file or remove the existing mod first."
-                        ))
-                        return
+                if self.mod_manager.exists_by_name(mod_name):
+                    self.root.after(
+                        0, messagebox.showwarning,
+                        "Mod Already Exists",
+                        f"A mod with the name '{mod_name}' already exists.\n\nPlease rename the file or remove the existing mod first."
+                    )
+                    return
 
                 # Copy archive to mods directory
-                self.root.after(0, lambda: self.status_bar.set_status("Copying archive to mods directory..."))
+                self.root.after(0, self.status_bar.set_status, "Copying archive to mods directory...")
 
                 mods_dir = Path(app_config.DEFAULT_MODS_DIR)
                 mods_dir.mkdir(parents=True, exist_ok=True)
 
-                # Generate unique filename if necessary
-                archive_name = Path(file_path).name
-                dest_path = mods_dir / archive_name
-                counter = 1
-                while dest_path.exists():
-                    name_part = Path(file_path).stem
-                    ext_part = Path(file_path).suffix
-                    archive_name = f"{name_part}_{counter}{ext_part}"
+                # Reserve a unique filename atomically (O_EXCL) instead of stat-probing,
+                # so concurrent installs can't race for the same name
+                archive_name = src_name
+                counter = 0
+                while True:
                     dest_path = mods_dir / archive_name
-                    counter += 1
+                    try:
+                        with open(dest_path, 'xb'):
+                            pass
+                        break
+                    except FileExistsError:
+                        counter += 1
+                        archive_name = f"{src_stem}_{counter}{src_suffix}"
 
-                # Copy the file
-                import shutil
-                shutil.copy2(file_path, dest_path)
+                # Copy the file into the reserved name; the copy has the source's size
+                file_size = os.path.getsize(file_path)
+                try:
+                    shutil.copyfile(file_path, dest_path)
+                except Exception:
+                    dest_path.unlink(missing_ok=True)
+                    raise
 
                 # Add mod to database using user-provided information
-                self.root.after(0, lambda: self.status_bar.set_status("Adding mod to database..."))
+                self.root.after(0, self.status_bar.set_status, "Adding mod to database...")
                 
                 # Build mod data with user-provided info or fallbacks
                 mod_data = {
                     "mod_name": mod_name,
                     "nexus_mod_id": mod_info.get('nexus_mod_id'),  # Will be None if not provided
                     "author": mod_info.get('author') or "Unknown",
-                    "summary": mod_info.get('summary') or f"Local mod installed from {Path(file_path).name}",
+                    "summary": mod_info.get('summary') or f"Local mod installed from {src_name}",
                     "latest_version": mod_info.get('version') or "1.0.0",
                     "enabled": auto_enable
                 }
 
-                new_mod_id = self.mod_manager.add_mod(mod_data)
-
-                # Add archive record
                 archive_version = mod_info.get('version') or "1.0.0"
-                file_size = dest_path.stat().st_size if dest_path.exists() else None
-                self.archive_manager.add_archive(
-                    mod_id=new_mod_id,
-                    version=archive_version,
-                    file_name=archive_name,
-                    file_size=file_size
-                )
+
+                # Add mod and archive record in a single transaction
+                with self.db_manager.transaction():
+                    new_mod_id = self.mod_manager.add_mod(mod_data)
+                    self.archive_manager.add_archive(
+                        mod_id=new_mod_id,
+                        version=archive_version,
+                        file_name=archive_name,
+                        file_size=file_size
+                    )
+                if mod_data["nexus_mod_id"]:
+                    self.config_manager.set_has_nexus_mods(True)
+                    # A cached update check wouldn't include the new mod
+                    self._last_update_check = None
 
                 # Refresh the UI on main thread
                 self.root.after(0, self.refresh_mod_list)
-                self.root.after(0, lambda: self.status_bar.set_status(f"Successfully added mod: {mod_name}"))
+                self.root.after(0, self.status_bar.set_status, f"Successfully added mod: {mod_name}")
 
                 # Show success message
                 message = f"Successfully added mod '{mod_name}'"
@@ -912,18 +1197,18 @@ class MainWindow:
                     message += " and enabled it"
                 message += "."
                 
-                self.root.after(0, lambda: self.status_bar.set_status(message))
+                self.root.after(0, self.status_bar.set_status, message)
                 
             except Exception as e:
                 error_msg = f"Error installing mod: {e}"
-                self.root.after(0, lambda: messagebox.showerror("Installation Error", error_msg))
-                self.root.after(0, lambda: self.status_bar.set_status(error_msg))
+                self.root.after(0, messagebox.showerror, "Installation Error", error_msg)
+                self.root.after(0, self.status_bar.set_status, error_msg)
         
         # Create task using thread manager
         thread_manager = get_thread_manager()
         task_id = thread_manager.create_task(
             task_type=TaskType.INSTALL,
-            description=f"Installing mod from file: {os.path.basename(file_path)}",
+            description=f"Installing mod from file: {src_name}",
             target=install_thread,
             can_cancel=True  # Installations can be cancelled
         )
@@ -937,23 +1222,85 @@ class MainWindow:
                 # Ensure the UI is properly updated on the main thread
                 if hasattr(self.mod_list_frame, 'load_mod_data'):
                     self.mod_list_frame.load_mod_data()
-                    # Force UI update to ensure rendering
-                    self.root.update_idletasks() 
                 else:
                     logger.warning("Warning: mod_list_frame missing load_mod_data method")
             else:
                 logger.warning("Warning: mod_list_frame not available for refresh")
-        except Exception as e:
-            logger.error(f"Error refreshing mod list: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error refreshing mod list")
+    
+    def _schedule_refresh(self, delay=50):
+        """Schedule a mod list refresh, replacing any refresh still pending"""
+        if self._refresh_pending:
+            self.root.after_cancel(self._refresh_pending)
+        self._refresh_pending = self.root.after(delay, self._do_refresh)
+    
+    def _do_refresh(self):
+        """Run a scheduled mod list refresh"""
+        self._refresh_pending = None
+        self.refresh_mod_list()
+    
+    def _queue_status(self, percent=None, text=None):
+        """Queue a progress and/or status update from a worker thread
+        
+        Updates are coalesced: one drain callback applies only the latest progress and
+        status, however many updates were queued before the Tk loop got to it.
+        """
+        self._status_queue.put_nowait((percent, text))
+        if not self._status_drain_pending:
+            self._status_drain_pending = True
+            self.root.after(0, self._drain_status_queue)
+    
+    def _drain_status_queue(self):
+        """Apply the latest queued progress and status (main thread)"""
+        self._status_drain_pending = False
+        percent = text = None
+        while True:
+            try:
+                queued_percent, queued_text = self._status_queue.get_nowait()
+            except queue.Empty:
+                break
+            if queued_percent is not None:
+                percent = queued_percent
+            if queued_text is not None:
+                text = queued_text
+        
+        if percent is not None:
+            self.status_bar.set_progress(percent)
+        if text is not None:
+            self.status_bar.set_status(text)
+    
+    def _progress_changed(self, percent):
+        """Record percent as this thread's last posted value, returning whether it changed"""
+        if percent == getattr(self._progress_local, "last", None):
+            return False
+        self._progress_local.last = percent
+        return True
+    
+    def _post_progress(self, percent):
+        """Queue a progress value from a worker thread only when it changes"""
+        if self._progress_changed(percent):
+            self._queue_status(percent=percent)
+    
+    def _post_progress_status(self, percent, text):
+        """Queue progress and status together, skipping updates where the percent hasn't changed"""
+        if self._progress_changed(percent):
+            self._queue_status(percent, text)
+    
+    def _schedule_ui_layout(self, delay=100):
+        """Schedule a layout check, replacing any check still pending"""
+        if self._layout_pending:
+            self.root.after_cancel(self._layout_pending)
+        self._layout_pending = self.root.after(delay, self._do_ui_layout)
+    
+    def _do_ui_layout(self):
+        """Run a scheduled layout check"""
+        self._layout_pending = None
+        self._ensure_ui_layout()
     
     def _ensure_ui_layout(self):
         """Ensure UI layout is properly rendered"""
         try:
-            # Force update of all widgets
-            self.root.update_idletasks()
-            
             # Check if mod list frame is properly visible
             if hasattr(self, 'mod_list_frame') and self.mod_list_frame:
                 if hasattr(self.mod_list_frame, 'tree'):
@@ -965,7 +1312,7 @@ class MainWindow:
                     else:
                         logger.warning("Warning: Mod list tree is not properly visible")
                         # Try again after a short delay
-                        self.root.after(100, self._ensure_ui_layout)
+                        self._schedule_ui_layout(100)
         except Exception as e:
             logger.error(f"Error ensuring UI layout: {e}")
     
@@ -975,15 +1322,12 @@ class MainWindow:
             # Show the window
             self.root.deiconify()
             
-            # Force update to ensure proper layout
-            self.root.update_idletasks()
-            
             # Ensure mod list is properly rendered
             self._ensure_ui_layout()
             
             # Refresh mod list to ensure content is visible
             # This fixes the issue where the list panel doesn't render when window was hidden
-            self.root.after(50, self.refresh_mod_list)
+            self._schedule_refresh(50)
             
         except Exception as e:
             logger.error(f"Error showing window: {e}")
@@ -999,7 +1343,7 @@ class MainWindow:
         """Handle window being mapped (shown)"""
         if event and event.widget == self.root:
             # Window is now visible, ensure UI is properly rendered
-            self.root.after(100, self._ensure_ui_layout)
+            self._schedule_ui_layout(100)
     
     def _on_window_visibility_changed(self, event=None):
         """Handle window visibility changes"""
@@ -1007,48 +1351,56 @@ class MainWindow:
             # Check if window became fully visible (state values: VisibilityUnobscured=0, VisibilityPartiallyObscured=1, VisibilityFullyObscured=2)
             if hasattr(event, 'state') and event.state == 0:  # VisibilityUnobscured
                 # Window is fully visible, refresh mod list to ensure rendering
-                self.root.after(50, self.refresh_mod_list)
+                self._schedule_refresh(50)
     
-    def open_settings(self):
+    @_requires_database
+    def open_settings(self, event=None):
         """Show settings dialog"""
-        from gui.dialogs import SettingsDialog
+        from gui import SettingsDialog
+        
+        # Remember the current API key so changes can be detected without re-reading it
+        prev_api_key = self.config_manager.get_api_key()
         
         # Create dialog with current settings
         dialog = SettingsDialog(self, self.config_manager) 
         result = dialog.show()
         if result:
             try:
-                # Save all settings to database
-                self.config_manager.set_auto_check_updates(result["auto_check_updates"])
-                self.config_manager.set_update_interval(result["update_interval"])
-                self.config_manager.set_confirm_actions(result["confirm_actions"])
-                self.config_manager.set_show_notifications(result["show_notifications"])
-                self.config_manager.set_backup_before_deploy(result["backup_before_deploy"])
-                self.config_manager.set_test_archive_integrity(result["test_archive_integrity"])
+                # Save all settings to database in a single write
+                settings = {
+                    "auto_check_updates": "true" if result["auto_check_updates"] else "false",
+                    "update_interval_hours": str(result["update_interval"]),
+                    "confirm_actions": "true" if result["confirm_actions"] else "false",
+                    "show_notifications": "true" if result["show_notifications"] else "false",
+                    "backup_before_deploy": "true" if result["backup_before_deploy"] else "false",
+                    "test_archive_integrity": "true" if result["test_archive_integrity"] else "false",
+                }
                 
                 if result["api_key"]:
-                    self.config_manager.set_api_key(result["api_key"])
+                    settings["nexus_api_key"] = result["api_key"]
                 
                 if result["game_path"]:
-                    self.config_manager.set_game_path(result["game_path"])
+                    settings["game_path"] = result["game_path"]
                 
                 if result["mods_path"]:
-                    self.config_manager.set_mods_directory(result["mods_path"])
+                    settings["mods_directory"] = result["mods_path"]
+                
+                self.config_manager.set_many(settings)
                 
                 self.status_bar.set_status("Settings updated and saved")
                 
                 # Update connection status if API key was set
                 if result["api_key"]:
                     # Only update status if API key actually changed
-                    current_api_key = self.config_manager.get_api_key()
-                    if result["api_key"] != current_api_key:
+                    if result["api_key"] != prev_api_key:
+                        self._api_validated_at = None
                         self.status_bar.set_connection_status("API key updated (validating...)")
                         # Reinitialize API components with new settings (this will validate the key)
                         self.init_api_components()
                     else:
                         # API key didn't change, just reinitialize components
                         self.init_api_components()
-                elif self.config_manager.get_api_key():
+                elif prev_api_key:
                     # API key was cleared
                     self.nexus_client = None
                     self.status_bar.set_connection_status("No API key configured")
@@ -1067,17 +1419,16 @@ class MainWindow:
     
     def enable_selected_mod(self):
         """Enable the currently selected mod"""
-        selected_mod = self.mod_list_frame.get_selected_mod()
-        if selected_mod:
-            self.enable_mod(selected_mod)
+        if self._selected_mod:
+            self.enable_mod(self._selected_mod)
     
     def disable_selected_mod(self):
         """Disable the currently selected mod"""
-        selected_mod = self.mod_list_frame.get_selected_mod()
-        if selected_mod:
-            self.disable_mod(selected_mod)
+        if self._selected_mod:
+            self.disable_mod(self._selected_mod)
     
-    def enable_all_mods(self):
+    @_requires_database
+    def enable_all_mods(self, event=None):
         """Enable all mods (staging only)"""
         try:
             all_mods = self.mod_manager.get_all_mods()
@@ -1095,33 +1446,35 @@ class MainWindow:
             if not result:
                 return
             
-            enabled_count = 0
+            mod_ids_to_enable = []
             skipped_count = 0
             
+            # Look up which mods have deployment configuration in one query
+            configured = self.deployment_manager.mods_with_selections(
+                [mod['id'] for mod in all_mods if mod.get('id') and not mod.get('enabled')]
+            )
+            
             for mod in all_mods:
                 if mod.get('enabled'):
                     # Skip already enabled mods
                     skipped_count += 1
                     continue
                 
-                # Check if mod has deployment configuration
                 mod_id = mod.get('id')
                 if mod_id:
-                    selections = self.deployment_manager.get_deployment_selections(mod_id)
-                    if not selections:
+                    if mod_id not in configured:
                         # Skip mods without deployment configuration
                         skipped_count += 1
                         continue
                     
-                    # Enable the mod
-                    success = self.mod_list_frame.update_mod_status(mod_id, True)
-                    if success:
-                        enabled_count += 1
-                    else:
-                        skipped_count += 1
+                    mod_ids_to_enable.append(mod_id)
+            
+            # Enable all eligible mods in a single transaction
+            enabled_count = self.mod_manager.bulk_set_enabled(mod_ids_to_enable, True)
+            skipped_count += len(mod_ids_to_enable) - enabled_count
             
             # Update UI
-            self.mod_list_frame.refresh_list()
+            self.mod_list_frame.load_mod_data()
             
             # Show status message
             if enabled_count > 0:
@@ -1135,17 +1488,16 @@ class MainWindow:
             logger.error(f"Error enabling all mods: {e}")
             self.status_bar.set_status(f"Error enabling all mods: {e}")
     
-    def disable_all_mods(self):
+    @_requires_database
+    def disable_all_mods(self, event=None):
         """Disable all mods (staging only)"""
         try:
-            all_mods = self.mod_manager.get_all_mods()
-            if not all_mods:
-                self.status_bar.set_status("No mods found to disable")
-                return
-            
-            enabled_mods = [mod for mod in all_mods if mod.get('enabled')]
+            enabled_mods = self.mod_manager.get_enabled_mods()
             if not enabled_mods:
-                self.status_bar.set_status("No enabled mods to disable")
+                if self.mod_manager.has_any_mods():
+                    self.status_bar.set_status("No enabled mods to disable")
+                else:
+                    self.status_bar.set_status("No mods found to disable")
                 return
             
             # Confirm the action
@@ -1158,17 +1510,12 @@ class MainWindow:
             if not result:
                 return
             
-            disabled_count = 0
-            
-            for mod in enabled_mods:
-                mod_id = mod.get('id')
-                if mod_id:
-                    success = self.mod_list_frame.update_mod_status(mod_id, False)
-                    if success:
-                        disabled_count += 1
+            # Disable all enabled mods in a single transaction
+            mod_ids_to_disable = [mod['id'] for mod in enabled_mods if mod.get('id')]
+            disabled_count = self.mod_manager.bulk_set_enabled(mod_ids_to_disable, False)
             
             # Update UI
-            self.mod_list_frame.refresh_list()
+            self.mod_list_frame.load_mod_data()
             
             # Show status message
             if disabled_count > 0:
@@ -1190,10 +1537,9 @@ class MainWindow:
                 return
             
             # Check if mod has deployment configuration
-            selections = self.deployment_manager.get_deployment_selections(mod_id)
-            if not selections:
+            if not self.deployment_manager.has_selections(mod_id):
                 # Show file selection dialog first
-                from gui.dialogs import DeploymentSelectionDialog
+                from gui import DeploymentSelectionDialog
                 dialog = DeploymentSelectionDialog(self, mod_data)  
                 result = dialog.show()
                 if not result:
@@ -1203,13 +1549,13 @@ class MainWindow:
                 self.deployment_manager.save_deployment_selections(mod_id, result["selected_files"])
             
             # Enable the mod in database (staging only)
-            success = self.mod_list_frame.update_mod_status(mod_id, True)
-            if success:
+            updated_mod = self.mod_list_frame.update_mod_status(mod_id, True)
+            if updated_mod:
                 self.status_bar.set_status(f"Enabled mod: {mod_data.get('name', 'Unknown')} (use 'Deploy Changes' to apply)")
-                # Refresh the details panel
-                updated_mod = self.mod_manager.get_mod(mod_id)
-                if updated_mod:
-                    self.mod_details_frame.display_mod(updated_mod)
+                # The list row is updated in place, so refresh the buttons, details panel
+                # and cached selection from the row returned by the update
+                self._selected_mod = updated_mod
+                self._apply_mod_selection(updated_mod)
             else:
                 self.status_bar.set_status(f"Failed to enable mod: {mod_data.get('name', 'Unknown')}")
                 
@@ -1225,13 +1571,13 @@ class MainWindow:
                 return
             
             # Disable the mod in database (staging only)
-            success = self.mod_list_frame.update_mod_status(mod_id, False)
-            if success:
+            updated_mod = self.mod_list_frame.update_mod_status(mod_id, False)
+            if updated_mod:
                 self.status_bar.set_status(f"Disabled mod: {mod_data.get('name', 'Unknown')} (use 'Deploy Changes' to apply)")
-                # Refresh the details panel
-                updated_mod = self.mod_manager.get_mod(mod_id)
-                if updated_mod:
-                    self.mod_details_frame.display_mod(updated_mod)
+                # The list row is updated in place, so refresh the buttons, details panel
+                # and cached selection from the row returned by the update
+                self._selected_mod = updated_mod
+                self._apply_mod_selection(updated_mod)
             else:
                 self.status_bar.set_status(f"Failed to disable mod: {mod_data.get('name', 'Unknown')}")
                 
@@ -1241,14 +1587,14 @@ class MainWindow:
     
     def configure_file_deployment(self):
         """Configure file deployment for selected mod"""
-        selected_mod = self.mod_list_frame.get_selected_mod()
-        if selected_mod:
-            self.configure_file_deployment_for_mod(selected_mod)
+        if self._selected_mod:
+            self.configure_file_deployment_for_mod(self._selected_mod)
         else:
             messagebox.showwarning("No Selection", "Please select a mod first.")
     
     def configure_file_deployment_for_mod(self, mod_data):
         """Show file deployment configuration for a specific mod"""
+        from gui import DeploymentSelectionDialog
         dialog = DeploymentSelectionDialog(self, mod_data)  
         result = dialog.show()
         if result:
@@ -1270,71 +1616,124 @@ class MainWindow:
         else:
             self.status_bar.set_status("Deployment configuration cancelled")
     
-    def remove_selected_mod(self):
+    def remove_selected_mod(self, event=None):
         """Remove the currently selected mod"""
-        selected_mod = self.mod_list_frame.get_selected_mod()
-        if selected_mod:
-            self.remove_mod(selected_mod)
+        if self._selected_mod:
+            self.remove_mods([self._selected_mod])
     
     def remove_mod(self, mod_data):
         """Remove a specific mod"""
+        self.remove_mods([mod_data])
+    
+    def remove_mods(self, mod_list):
+        """Remove several mods behind a single confirmation, list refresh and status update"""
+        mod_list = [mod for mod in mod_list if mod.get("id")]
+        if not mod_list:
+            self.status_bar.set_status("Error: Could not identify mod to remove")
+            return
+        
+        names = [mod.get("name", "Unknown") for mod in mod_list]
+        if len(mod_list) == 1:
+            prompt = f"Are you sure you want to remove '{names[0]}'?"
+        else:
+            prompt = f"Are you sure you want to remove these {len(mod_list)} mods?\n\n" + "\n".join(
+                f"• {name}" for name in names
+            )
         result = messagebox.askyesno(
             "Confirm Removal", 
-            f"Are you sure you want to remove '{mod_data.get('name', 'Unknown')}'?\n\n"
-            "This will delete the mod archive and remove all deployed files."
+            f"{prompt}\n\n"
+            "This will delete the mod archives and remove all deployed files."
         )
-        if result:
+        if not result:
+            return
+        
+        mod_ids = [mod["id"] for mod in mod_list]
+        label = f"mod: {names[0]}" if len(mod_list) == 1 else f"{len(mod_list)} mods"
+        self.status_bar.set_status(f"Removing {label}...")
+        
+        def remove_thread():
+            """Delete the mods' files and database rows off the UI thread"""
             try:
-                mod_id = mod_data.get("id")
-                mod_name = mod_data.get("name", "Unknown")
-                
-                # Remove deployed files from game directory if file manager is available
-                if self.file_manager and mod_id:
-                    try:
-                        deployed_files = self.deployment_manager.get_deployed_file_paths(mod_id)
-                        if deployed_files:
-                            self.file_manager.remove_deployed_files(deployed_files)
-                            logger.info(f"Removed {len(deployed_files)} deployed files")
-                    except Exception as e:
-                        logger.error(f"Error removing deployed files: {e}")
-                
-                # Remove mod archive file if it exists
-                if mod_id:
+                for mod_id in mod_ids:
+                    # Remove deployed files from game directory if file manager is available
+                    if self.file_manager:
+                        try:
+                            deployed_files = self.deployment_manager.get_deployed_file_paths(mod_id)
+                            if deployed_files:
+                                self.file_manager.remove_deployed_files(deployed_files)
+                                logger.info(f"Removed {len(deployed_files)} deployed files")
+                        except Exception as e:
+                            logger.error(f"Error removing deployed files: {e}")
+                    
+                    # Remove mod archive file if it exists
                     try:
                         active_archive = self.archive_manager.get_active_archive(mod_id)
                         if active_archive:
                             archive_filename = active_archive.get("file_name")
                             if archive_filename:
                                 # Remove the physical archive file
-                                import config as app_config
-                                import os
-                                archive_path = os.path.join(app_config.DEFAULT_MODS_DIR, archive_filename)
-                                if os.path.exists(archive_path):
-                                    os.remove(archive_path)
-                                    logger.info(f"Removed archive file: {archive_filename}")
+                                Path(app_config.DEFAULT_MODS_DIR, archive_filename).unlink(missing_ok=True)
+                                logger.info(f"Removed archive file: {archive_filename}")
                     except Exception as e:
                         logger.error(f"Error removing archive file: {e}")
                 
-                # Remove from database (cascading delete will handle related records)
-                if mod_id and self.mod_list_frame:
-                    success = self.mod_list_frame.remove_mod(mod_id)
-                    if success:
-                        self.status_bar.set_status(f"Successfully removed mod: {mod_name}")
-                        # Refresh the mod list display
-                        self.refresh_mod_list()
-                    else:
-                        self.status_bar.set_status(f"Error removing mod from database: {mod_name}")
-                else:
-                    self.status_bar.set_status("Error: Could not identify mod to remove")
-                    
+                # Remove from database in one statement batch (cascading delete will handle related records)
+                self.mod_manager.remove_mods(mod_ids)
+                # A cached update check may still list the removed mods
+                self._last_update_check = None
+                if any(mod.get("nexus_mod_id") for mod in mod_list):
+                    self.config_manager.set_has_nexus_mods(self.mod_manager.has_nexus_mods())
+                
+                self.root.after(0, self._on_mods_removed, mod_ids, label)
+                
             except Exception as e:
                 logger.error(f"Error during mod removal: {e}")
-                self.status_bar.set_status(f"Error removing mod: {e}")
+                error_msg = f"Error removing mod: {e}"
+                self.root.after(0, lambda: self.status_bar.set_status(error_msg))
+        
+        # Create task using thread manager
+        thread_manager = get_thread_manager()
+        task_id = thread_manager.create_task(
+            task_type=TaskType.REMOVE_MOD,
+            description=f"Removing {label}",
+            target=remove_thread,
+            can_cancel=False
+        )
+        
+        logger.info(f"Started mod removal task: {task_id}")
+    
+    def _on_mods_removed(self, mod_ids, label):
+        """Refresh the UI once mods have been removed (runs on the UI thread)"""
+        if self._selected_mod and self._selected_mod.get("id") in mod_ids:
+            self._selected_mod = None
+        self.refresh_mod_list()
+        self.status_bar.set_status(f"Successfully removed {label}")
+    
+    def _recent_update_check(self):
+        """Return the updates found by the last update check if it is still fresh, else None"""
+        last_check = self._last_update_check
+        if last_check and time.monotonic() - last_check['ts'] < self.UPDATE_CHECK_REUSE_SECONDS:
+            return last_check['updates_available']
+        return None
     
-    def check_for_updates(self):
+    def _iter_mod_info(self, nexus_mods):
+        """Fetch Nexus info for each mod concurrently, yielding (mod, future) as they complete"""
+        futures = {
+            self._nexus_pool.submit(self.nexus_client.get_mod_info, mod['nexus_mod_id']): mod
+            for mod in nexus_mods
+        }
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future
+        finally:
+            # Drop lookups that haven't started if the caller stops early
+            for future in futures:
+                future.cancel()
+    
+    @_requires_database
+    def check_for_updates(self, event=None):
         """Check for updates for all mods"""
         from api.nexus_api import NexusAPIError
-        from utils.thread_manager import get_thread_manager, TaskType
         
         if not self.nexus_client:
             messagebox.showwarning("API Not Available", "No API key configured. Please go to Settings > Nexus API and add your API key.")
@@ -1349,31 +1748,28 @@ class MainWindow:
                 nexus_mods = [mod for mod in all_mods if mod.get('nexus_mod_id')]
                 
                 if not nexus_mods:
-                    self.root.after(0, lambda: self.status_bar.set_status("No Nexus mods to check for updates"))
-                    self.root.after(0, lambda: self.status_bar.set_status("No Nexus mods to check"))
+                    self.root.after(0, self.status_bar.set_status, "No Nexus mods to check for updates")
                     return
                 
                 updates_available = []
                 errors = []
                 checked_count = 0
                 
-                for mod in nexus_mods:
+                for mod, future in self._iter_mod_info(nexus_mods):
                     try:
-                        mod_id = mod['nexus_mod_id']
                         current_version = mod.get('latest_version', '0.0.0')
                         
                         # Update progress
                         checked_count += 1
                         progress = int((checked_count / len(nexus_mods)) * 100)
-                        self.root.after(0, lambda p=progress: self.status_bar.set_progress(p))
-                        self.root.after(0, lambda m=mod: self.status_bar.set_status(f"Checking {m['mod_name']}..."))
+                        self._post_progress_status(progress, f"Checked {mod['mod_name']}...")
                         
                         # Get latest mod info
-                        mod_info = self.nexus_client.get_mod_info(mod_id)
+                        mod_info = future.result()
                         latest_version = mod_info.get('version', '0.0.0')
                         
                         # Simple version comparison (this could be improved)
-                        if latest_version != current_version:
+                        if _is_newer_version(latest_version, current_version):
                             updates_available.append({
                                 'mod': mod,
                                 'current_version': current_version,
@@ -1389,8 +1785,15 @@ class MainWindow:
                     except Exception as e:
                         errors.append(f"{mod['mod_name']}: Unexpected error - {e}")
                 
+                # Remember a complete result so "Update All" can skip an immediate re-check;
+                # mods that failed to check would otherwise be silently left out of the update
+                if errors:
+                    self._last_update_check = None
+                else:
+                    self._last_update_check = {'ts': time.monotonic(), 'updates_available': updates_available}
+                
                 # Show results on main thread
-                self.root.after(0, lambda: self.status_bar.set_progress(0))
+                self._post_progress(0)
                 
                 if updates_available or errors:
                     self.root.after(0, lambda: self.show_update_results(updates_available, errors))
@@ -1406,7 +1809,7 @@ class MainWindow:
                 self.root.after(0, lambda: messagebox.showerror("Update Check Error", error_msg))
                 self.root.after(0, lambda: self.status_bar.set_status(error_msg))
             finally:
-                self.root.after(0, lambda: self.status_bar.set_progress(0))
+                self._post_progress(0)
         
         # Create task using thread manager
         thread_manager = get_thread_manager()
@@ -1419,11 +1822,9 @@ class MainWindow:
         
         logger.info(f"Started update check task: {task_id}")
     
-    def update_all_mods(self):
+    @_requires_database
+    def update_all_mods(self, event=None):
         """Update all mods that have updates available"""
-        from api.nexus_api import NexusAPIError
-        from utils.thread_manager import get_thread_manager, TaskType
-        
         if not self.nexus_client:
             messagebox.showwarning("API Not Available", "No API key configured. Please go to Settings > Nexus API and add your API key.")
             return
@@ -1433,43 +1834,45 @@ class MainWindow:
         
         def update_all_thread():
             try:
-                # Get all mods with Nexus IDs
-                all_mods = self.mod_manager.get_all_mods()
-                nexus_mods = [mod for mod in all_mods if mod.get('nexus_mod_id')]
-                
-                if not nexus_mods:
-                    self.root.after(0, lambda: self.status_bar.set_status("No Nexus mods to update"))
-                    return
-                
-                updates_available = []
-                errors = []
-                
-                # Check for updates first
-                self.root.after(0, lambda: self.status_bar.set_status("Checking which mods need updates..."))
-                
-                for mod in nexus_mods:
-                    try:
-                        mod_id = mod['nexus_mod_id']
-                        current_version = mod.get('latest_version', '0.0.0')
-                        
-                        # Get latest mod info
-                        mod_info = self.nexus_client.get_mod_info(mod_id)
-                        latest_version = mod_info.get('version', '0.0.0')
-                        
-                        # Simple version comparison
-                        if latest_version != current_version:
-                            updates_available.append({
-                                'mod': mod,
-                                'current_version': current_version,
-                                'latest_version': latest_version,
-                                'mod_info': mod_info
-                            })
+                # Reuse a recent "Check for Updates" result instead of querying Nexus again
+                updates_available = self._recent_update_check()
+                if updates_available is None:
+                    # Get all mods with Nexus IDs
+                    all_mods = self.mod_manager.get_all_mods()
+                    nexus_mods = [mod for mod in all_mods if mod.get('nexus_mod_id')]
+                    
+                    if not nexus_mods:
+                        self.root.after(0, lambda: self.status_bar.set_status("No Nexus mods to update"))
+                        return
+                    
+                    updates_available = []
+                    errors = []
+                    
+                    # Check for updates first
+                    self.root.after(0, lambda: self.status_bar.set_status("Checking which mods need updates..."))
+                    
+                    for mod, future in self._iter_mod_info(nexus_mods):
+                        try:
+                            current_version = mod.get('latest_version', '0.0.0')
                             
-                            # Update the mod's latest version in database
-                            self.mod_manager.update_mod(mod['id'], {'latest_version': latest_version})
+                            # Get latest mod info
+                            mod_info = future.result()
+                            latest_version = mod_info.get('version', '0.0.0')
+                            
+                            # Simple version comparison
+                            if _is_newer_version(latest_version, current_version):
+                                updates_available.append({
+                                    'mod': mod,
+                                    'current_version': current_version,
+                                    'latest_version': latest_version,
+                                    'mod_info': mod_info
+                                })
+                                
+                                # Update the mod's latest version in database
+                                self.mod_manager.update_mod(mod['id'], {'latest_version': latest_version})
                         
-                    except Exception as e:
-                        errors.append(f"{mod['mod_name']}: {e}")
+                        except Exception as e:
+                            errors.append(f"{mod['mod_name']}: {e}")
                 
                 if not updates_available:
                     self.root.after(0, lambda: self.status_bar.set_status("All mods are up to date"))
@@ -1511,102 +1914,115 @@ class MainWindow:
         
         logger.info(f"Started update all preparation task: {task_id}")
     
+    @staticmethod
+    def _remove_old_archive(old_path):
+        """Delete a superseded archive file, ignoring ones that are already gone"""
+        try:
+            old_path.unlink(missing_ok=True)
+            logger.info(f"Removed old archive: {old_path}")
+        except OSError as e:
+            logger.warning(f"Could not remove old archive {old_path}: {e}")
+    
     def perform_bulk_updates(self, updates_available):
         """Perform the actual bulk updates"""
         from api.nexus_api import NexusAPIError, ModDownloader
-        from utils.thread_manager import get_thread_manager, TaskType
-        import config as app_config
-        import os
-        from pathlib import Path
         
         def bulk_update_thread():
             try:
                 updated_count = 0
                 failed_count = 0
+                completed_count = 0
                 total_count = len(updates_available)
+                downloader = ModDownloader(self.nexus_client, app_config.DEFAULT_MODS_DIR)
+                mods_dir = Path(app_config.DEFAULT_MODS_DIR)
+                
+                # Existing archives for every mod being updated, fetched in one query
+                archives_by_mod = self.archive_manager.get_archives_for_mods(
+                    [update['mod']['id'] for update in updates_available]
+                )
+                
+                # Bytes downloaded and expected size per mod, shared by the download workers
+                downloaded_bytes = {}
+                download_totals = {}
+                progress_lock = threading.Lock()
+                started_at = time.monotonic()
+                last_status_at = 0.0
                 
-                for i, update in enumerate(updates_available):
-                    mod = update['mod']
-                    mod_name = mod.get('mod_name', 'Unknown')
+                def download_update(update):
+                    nexus_mod_id = update['mod']['nexus_mod_id']
                     
-                    try:
-                        self.root.after(0, lambda m=mod_name, c=i+1, t=total_count: 
-                                      self.status_bar.set_status(f"Updating {m} ({c}/{t})..."))
+                    # Get latest main file
+                    files = self.nexus_client.get_mod_files(nexus_mod_id)
+                    latest_file = _select_latest_file(files)
+                    if not latest_file:
+                        raise NexusAPIError(f"No files found for mod {update['mod'].get('mod_name', 'Unknown')}")
+                    
+                    def progress_callback(current, total):
+                        nonlocal last_status_at
+                        with progress_lock:
+                            downloaded_bytes[nexus_mod_id] = current
+                            download_totals[nexus_mod_id] = total
+                            now = time.monotonic()
+                            if now - last_status_at < 0.1:
+                                return
+                            last_status_at = now
+                            rate = sum(downloaded_bytes.values()) / max(now - started_at, 1e-6) / (1024 * 1024)
+                        self._queue_status(text=f"Downloading {completed_count}/{total_count} mod(s), {rate:.1f} MB/s")
+                    
+                    return downloader.download_mod(nexus_mod_id, latest_file['file_id'], progress_callback, file_info=latest_file)
+                
+                with ThreadPoolExecutor(max_workers=self.BULK_DOWNLOAD_WORKERS, thread_name_prefix="BulkDownload") as executor:
+                    futures = {executor.submit(download_update, update): update for update in updates_available}
+                    
+                    # Record each finished download on this thread so database writes stay serialized
+                    for future in as_completed(futures):
+                        update = futures[future]
+                        mod = update['mod']
+                        mod_name = mod.get('mod_name', 'Unknown')
+                        completed_count += 1
                         
-                        # Get latest main file
-                        nexus_mod_id = mod['nexus_mod_id']
-                        files = self.nexus_client.get_mod_files(nexus_mod_id)
-                        main_files = [f for f in files if f.get('category_name') == 'MAIN']
-                        if not main_files:
-                            main_files = files  # Fall back to any file
+                        try:
+                            downloaded_path = future.result()
+                            
+                            if downloaded_path and os.path.exists(downloaded_path):
+                                # Add new archive record (size comes from the download when we streamed it)
+                                file_size = download_totals.get(mod['nexus_mod_id']) or os.path.getsize(downloaded_path)
+                                self.archive_manager.add_archive(
+                                    mod_id=mod['id'],
+                                    version=update['latest_version'],
+                                    file_name=os.path.basename(downloaded_path),
+                                    file_size=file_size,
+                                    set_active=True
+                                )
+                                
+                                # Update mod record
+                                self.mod_manager.update_mod(mod['id'], {
+                                    'latest_version': update['latest_version']
+                                })
+                                self.nexus_client.invalidate_mod_info(mod['nexus_mod_id'])
+                                
+                                # Only once the new archive is recorded, remove the old ones in the
+                                # background so the next result isn't held up
+                                for archive in archives_by_mod.get(mod['id'], []):
+                                    old_path = mods_dir / archive['file_name']
+                                    if str(old_path) != downloaded_path:
+                                        self._cleanup_pool.submit(self._remove_old_archive, old_path)
+                                
+                                updated_count += 1
+                                logger.info(f"Successfully updated {mod_name} to {update['latest_version']}")
+                            else:
+                                failed_count += 1
+                                logger.error(f"Failed to download {mod_name}")
                         
-                        if not main_files:
+                        except Exception as e:
                             failed_count += 1
-                            logger.warning(f"No files found for mod {mod_name}")
-                            continue
-                        
-                        # Use the first (usually latest) main file
-                        latest_file = main_files[0]
-                        file_id = latest_file['file_id']
-                        
-                        # Download the new version
-                        download_url = self.nexus_client.get_download_url(nexus_mod_id, file_id)
-                        
-                        # Create downloader
-                        downloader = ModDownloader(
-                            url=download_url,
-                            filename=latest_file['file_name'],
-                            target_dir=app_config.DEFAULT_MODS_DIR
-                        )
+                            logger.error(f"Error updating {mod_name}: {e}")
                         
-                        # Download with progress updates
-                        def progress_callback(current, total):
-                            if total > 0:
-                                percent = int((current / total) * 100)
-                                self.root.after(0, lambda p=percent, m=mod_name: 
-                                              self.status_bar.set_status(f"Downloading {m}: {p}%"))
-                        
-                        downloaded_path = downloader.download(progress_callback)
-                        
-                        if downloaded_path and os.path.exists(downloaded_path):
-                            # Remove old archive if it exists
-                            old_archives = self.archive_manager.get_mod_archives(mod['id'])
-                            for archive in old_archives:
-                                old_path = Path(app_config.DEFAULT_MODS_DIR) / archive['file_name']
-                                if old_path.exists():
-                                    try:
-                                        old_path.unlink()
-                                        logger.info(f"Removed old archive: {old_path}")
-                                    except Exception as e:
-                                        logger.warning(f"Could not remove old archive {old_path}: {e}")
-                            
-                            # Add new archive record
-                            file_size = os.path.getsize(downloaded_path)
-                            self.archive_manager.add_archive(
-                                mod_id=mod['id'],
-                                version=update['latest_version'],
-                                file_name=os.path.basename(downloaded_path),
-                                file_size=file_size,
-                                set_active=True
-                            )
-                            
-                            # Update mod record
-                            self.mod_manager.update_mod(mod['id'], {
-                                'latest_version': update['latest_version']
-                            })
-                            
-                            updated_count += 1
-                            logger.info(f"Successfully updated {mod_name} to {update['latest_version']}")
-                        else:
-                            failed_count += 1
-                            logger.error(f"Failed to download {mod_name}")
-                    
-                    except Exception as e:
-                        failed_count += 1
-                        logger.error(f"Error updating {mod_name}: {e}")
+                        self._queue_status(text=f"Updated {completed_count}/{total_count} mod(s)...")
                 
                 # Show final results  
                 if updated_count > 0:
+                    self._last_update_check = None
                     self.root.after(0, self.refresh_mod_list)  # Refresh the mod list
                 
                 success_msg = f"Update completed! Updated: {updated_count}, Failed: {failed_count}, Total: {total_count}"
@@ -1670,10 +2086,10 @@ class MainWindow:
             listbox.pack(fill=BOTH, expand=True)
             scrollbar.config(command=listbox.yview)
             
-            for update in updates_available:
-                mod = update['mod']
-                item_text = f"{mod['mod_name']} - {update['current_version']} → {update['latest_version']}"
-                listbox.insert(tk.END, item_text)
+            listbox.insert(tk.END, *(
+                f"{update['mod']['mod_name']} - {update['current_version']} → {update['latest_version']}"
+                for update in updates_available
+            ))
         
         # Errors tab
         if errors:
@@ -1697,8 +2113,7 @@ class MainWindow:
             text_widget.pack(fill=BOTH, expand=True)
             scrollbar_text.config(command=text_widget.yview)
             
-            for error in errors:
-                text_widget.insert(tk.END, error + "\n\n")
+            text_widget.insert(tk.END, "".join(f"{error}\n\n" for error in errors))
             text_widget.config(state=tk.DISABLED)
         
         # Button frame
@@ -1731,9 +2146,9 @@ class MainWindow:
         y = (self.root.winfo_rooty() + self.root.winfo_height() // 2 - dialog.winfo_height() // 2)
         dialog.geometry(f"+{x}+{y}")
     
-    def deploy_changes(self):
+    @_requires_database
+    def deploy_changes(self, event=None):
         """Deploy all pending changes to the game directory"""
-        from utils.thread_manager import get_thread_manager, TaskType
         
         if not self.file_manager:
             messagebox.showerror("Error", "File manager not initialized. Please check your game path in settings.")
@@ -1761,9 +2176,9 @@ class MainWindow:
         
         def deploy_thread():
             try:
-                import config as app_config
                 deployed_count = 0
                 errors = []
+                mods_dir = Path(app_config.DEFAULT_MODS_DIR)
                 
                 # Get backup setting
                 backup_before_deploy = self.config_manager.get_backup_before_deploy()
@@ -1776,8 +2191,7 @@ class MainWindow:
                 game_mgr.reset_deployment_session()
                 
                 # Get all enabled mods
-                all_mods = self.mod_manager.get_all_mods()
-                enabled_mods = [mod for mod in all_mods if mod['enabled']]
+                enabled_mods = self.mod_manager.get_enabled_mods()
                 
                 if not enabled_mods:
                     self.root.after(0, lambda: self.status_bar.set_status("No mods enabled to deploy"))
@@ -1786,24 +2200,29 @@ class MainWindow:
                 # Deploy files from enabled mods using new backup/wipe approach
                 total_mods = len(enabled_mods)
                 
+                # Load archives and selections for all enabled mods up front
+                mod_ids = [mod['id'] for mod in enabled_mods]
+                archives_by_mod = self.archive_manager.get_archives_for_mods(mod_ids)
+                selections_by_mod = self.deployment_manager.get_selections_for_mods(mod_ids)
+                pending_rows = []
+                
                 for i, mod in enumerate(enabled_mods):
                     try:
                         progress = int(((i + 1) / total_mods) * 100)
-                        self.root.after(0, lambda p=progress: self.status_bar.set_progress(p))
-                        self.root.after(0, lambda m=mod: self.status_bar.set_status(f"Deploying {m['mod_name']}..."))
+                        self._post_progress_status(progress, f"Deploying {mod['mod_name']}...")
                         
                         # Get mod archive
-                        archives = self.archive_manager.get_mod_archives(mod['id'])
+                        archives = archives_by_mod.get(mod['id'])
                         if not archives:
                             errors.append(f"No archive found for mod '{mod['mod_name']}'")
                             continue
                         
                         # Build full archive path
                         archive_filename = archives[0]['file_name']
-                        archive_path = os.path.join(app_config.DEFAULT_MODS_DIR, archive_filename)
+                        archive_path = mods_dir / archive_filename
                         
                         # Get deployment selections
-                        selections = self.deployment_manager.get_deployment_selections(mod['id'])
+                        selections = selections_by_mod.get(mod['id'])
                         if not selections:
                             errors.append(f"No file deployment configuration for mod '{mod['mod_name']}'. Please configure files first.")
                             continue
@@ -1817,14 +2236,12 @@ class MainWindow:
                                 backup_before_deploy=backup_before_deploy
                             )
                             
-                            # Record deployment in database
-                            for file_info in deployed_files:
-                                self.deployment_manager.add_deployed_file(
-                                    mod_id=mod['id'],
-                                    source_path=file_info['original_archive_path'],
-                                    deployed_path=file_info['deployed_path'],
-                                    original_backup_path=file_info.get('backup_path')
-                                )
+                            # Queue deployment records; they're written in one batch after the loop
+                            pending_rows.extend(
+                                (mod['id'], file_info['original_archive_path'],
+                                 file_info['deployed_path'], file_info.get('backup_path'))
+                                for file_info in deployed_files
+                            )
                             
                             # Count successful deployment
                             if deployed_files:
@@ -1835,8 +2252,16 @@ class MainWindow:
                         errors.append(error_msg)
                         logger.error(error_msg)
                 
+                # Record all deployed files in a single transaction
+                try:
+                    self.deployment_manager.add_deployed_files(pending_rows)
+                except Exception as e:
+                    error_msg = f"Error recording deployed files: {e}"
+                    errors.append(error_msg)
+                    logger.error(error_msg)
+                
                 # Show results on main thread
-                self.root.after(0, lambda: self.status_bar.set_progress(0))
+                self._post_progress(0)
                 
                 if errors:
                     self.root.after(0, lambda: self.show_deployment_results(deployed_count, errors))
@@ -1852,7 +2277,7 @@ class MainWindow:
                 self.root.after(0, lambda: self.status_bar.set_status(error_msg))
                 
             finally:
-                self.root.after(0, lambda: self.status_bar.set_progress(0))
+                self._post_progress(0)
         
         # Create task using thread manager
         thread_manager = get_thread_manager()
@@ -1910,8 +2335,7 @@ class MainWindow:
             text_widget.pack(fill=BOTH, expand=True)
             scrollbar.config(command=text_widget.yview)
             
-            for error in errors:
-                text_widget.insert(tk.END, error + "\n\n")
+            text_widget.insert(tk.END, "".join(f"{error}\n\n" for error in errors))
             text_widget.config(state=tk.DISABLED)
         
         # Button frame
@@ -1934,10 +2358,6 @@ class MainWindow:
     def update_mod(self, mod_data):
         """Update a specific mod to the latest version"""
         from api.nexus_api import NexusAPIError, ModDownloader
-        from utils.thread_manager import get_thread_manager, TaskType
-        import config as app_config
-        import os
-        from pathlib import Path
         
         if not self.nexus_client:
             messagebox.showwarning("API Not Available", "No API key configured. Please go to Settings > Nexus API and add your API key.")
@@ -1961,89 +2381,94 @@ class MainWindow:
         
         def update_thread():
             try:
-                # Get latest mod info
-                self.root.after(0, lambda: self.status_bar.set_status("Fetching latest mod information..."))
-                mod_info = self.nexus_client.get_mod_info(nexus_mod_id)
-                
-                # Get latest main file
-                self.root.after(0, lambda: self.status_bar.set_status("Finding latest mod file..."))
-                files = self.nexus_client.get_mod_files(nexus_mod_id)
-                main_files = [f for f in files if f.get('category_name') == 'MAIN']
-                if not main_files:
-                    main_files = files  # Fall back to any file
-                
-                if not main_files:
+                # Fetch latest mod info and file list concurrently
+                self.root.after(0, self.status_bar.set_status, "Fetching latest mod information...")
+                with ThreadPoolExecutor(max_workers=2, thread_name_prefix="NexusFetch") as executor:
+                    info_future = executor.submit(self.nexus_client.get_mod_info, nexus_mod_id)
+                    files_future = executor.submit(self.nexus_client.get_mod_files, nexus_mod_id)
+                    mod_info = info_future.result()
+                    files = files_future.result()
+                
+                # Get the most recent file (MAIN preferred)
+                latest_file = _select_latest_file(files)
+                if not latest_file:
                     self.root.after(0, lambda: messagebox.showerror(
                         "No Files", 
                         f"No downloadable files found for mod '{mod_info['name']}'."
                     ))
                     return
                 
-                # Get the most recent file
-                latest_file = max(main_files, key=lambda f: f.get('uploaded_timestamp', 0))
                 current_file_id = latest_file['file_id']
                 
                 # Create progress callback
+                status_prefix = f"Downloading {mod_info['name']}..."
+                
                 def progress_callback(downloaded, total):
                     if total > 0:
                         percent = int((downloaded / total) * 100)
-                        self.root.after(0, lambda: self.status_bar.set_progress(percent))
-                        self.root.after(0, lambda: self.status_bar.set_status(
-                            f"Downloading {mod_info['name']}... {percent}%"
-                        ))
+                        self._post_progress_status(percent, f"{status_prefix} {percent}%")
                 
                 # Download the updated mod
                 self.root.after(0, lambda: self.status_bar.set_status(f"Downloading updated {mod_info['name']}..."))
                 downloader = ModDownloader(self.nexus_client, app_config.DEFAULT_MODS_DIR)
-                new_archive_path = downloader.download_mod(nexus_mod_id, current_file_id, progress_callback)
+                new_archive_path = downloader.download_mod(nexus_mod_id, current_file_id, progress_callback, file_info=latest_file)
                 
-                # Get current archive info to remove old file
+                # Get current archive info to remove old file; the file list entry already
+                # carries the file details, and the record must name the file actually written
                 archives = self.archive_manager.get_mod_archives(mod_data['id'])
-                if archives:
-                    old_archive = archives[0]  # Get the current archive
-                    old_path = old_archive.get('file_path')
-                    
-                    # Remove old archive file if it exists
-                    if old_path and os.path.exists(old_path):
-                        try:
-                            os.remove(old_path)
-                        except Exception as e:
-                            logger.warning(f"Warning: Could not remove old archive: {e}")
-                    
-                    # Update archive record
-                    file_info = self.nexus_client.get_file_info(nexus_mod_id, current_file_id)
-                    self.archive_manager.update_archive(old_archive['id'], {
-                        'file_name': file_info['file_name'],
-                        'version': mod_info.get('version', '1.0.0'),
-                        'file_size': file_info.get('size_kb', 0) * 1024 if file_info.get('size_kb') else None
-                        # TODO: Store nexus_file_id and file_path in separate fields if needed
-                    })
-                else:
-                    # Add new archive record if none exists
-                    file_info = self.nexus_client.get_file_info(nexus_mod_id, current_file_id)
-                    self.archive_manager.add_archive(
-                        mod_id=mod_data['id'],
-                        version=mod_info.get('version', '1.0.0'),
-                        file_name=file_info['file_name'],
-                        file_size=file_info.get('size_kb', 0) * 1024 if file_info.get('size_kb') else None
-                        # TODO: Store nexus_file_id in a separate field if needed
-                    )
+                old_archive = archives[0] if archives else None  # Get the current archive
+                new_file_name = Path(new_archive_path).name
+                new_file_size = latest_file.get('size_kb', 0) * 1024 if latest_file.get('size_kb') else os.path.getsize(new_archive_path)
                 
-                # Update mod record
+                # Write the archive, mod and selection changes in one transaction
                 self.root.after(0, lambda: self.status_bar.set_status("Updating mod information..."))
-                self.mod_manager.update_mod(mod_data['id'], {
-                    'latest_version': mod_info.get('version', '1.0.0'),
-                    'summary': mod_info.get('summary', ''),
-                    'updated_at': 'NOW()'
-                })
-                
-                # Clear deployment selections so user can reconfigure if needed
-                self.deployment_manager.clear_deployment_selections(mod_data['id'])
+                with self.db_manager.transaction():
+                    if old_archive:
+                        # Update archive record
+                        self.archive_manager.update_archive(old_archive['id'], {
+                            'file_name': new_file_name,
+                            'version': mod_info.get('version', '1.0.0'),
+                            'file_size': new_file_size
+                            # TODO: Store nexus_file_id and file_path in separate fields if needed
+                        })
+                    else:
+                        # Add new archive record if none exists
+                        self.archive_manager.add_archive(
+                            mod_id=mod_data['id'],
+                            version=mod_info.get('version', '1.0.0'),
+                            file_name=new_file_name,
+                            file_size=new_file_size
+                            # TODO: Store nexus_file_id in a separate field if needed
+                        )
+                    
+                    # Update mod record
+                    self.mod_manager.update_mod(mod_data['id'], {
+                        'latest_version': mod_info.get('version', '1.0.0'),
+                        'summary': mod_info.get('summary', ''),
+                        'updated_at': 'NOW()'
+                    })
+                    
+                    # Clear deployment selections so user can reconfigure if needed
+                    self.deployment_manager.clear_deployment_selections(mod_data['id'])
+                
+                self.nexus_client.invalidate_mod_info(nexus_mod_id)
+                self._last_update_check = None
+                
+                # Delete the superseded archive in the background so the UI refreshes right away
+                if old_archive and old_archive.get('file_name'):
+                    old_path = Path(app_config.DEFAULT_MODS_DIR) / old_archive['file_name']
+                    if str(old_path) != new_archive_path:
+                        get_thread_manager().create_task(
+                            task_type=TaskType.CLEANUP,
+                            description=f"Deleting old archive {old_path.name}",
+                            target=self._remove_old_archive,
+                            args=(old_path,),
+                            can_cancel=False
+                        )
                 
                 # Refresh the UI on main thread
                 self.root.after(0, self.refresh_mod_list)
-                self.root.after(0, lambda: self.status_bar.set_progress(0))
-                self.root.after(0, lambda: self.status_bar.set_status(f"Successfully updated mod: {mod_info['name']}"))
+                self._post_progress(0)
                 
                 # Show success in status bar
                 self.root.after(0, lambda: self.status_bar.set_status(
@@ -2067,7 +2492,7 @@ class MainWindow:
                 self.root.after(0, lambda: self.status_bar.set_status(error_msg))
                 
             finally:
-                self.root.after(0, lambda: self.status_bar.set_progress(0))
+                self._post_progress(0)
         
         # Create task using thread manager
         thread_manager = get_thread_manager()
@@ -2080,9 +2505,10 @@ class MainWindow:
         
         logger.info(f"Started mod update task: {task_id}")
     
+    @_requires_database
     def open_game_directory(self):
         """Open the game directory in file explorer"""
-        game_path = self.config_manager.get_game_path() if hasattr(self, 'config_manager') else None
+        game_path = self.config_manager.get_game_path()
         if not game_path or not os.path.exists(game_path):
             self.status_bar.set_status("Game path not set or does not exist. Please configure it in Settings.")
             return
@@ -2092,9 +2518,10 @@ class MainWindow:
         except Exception as e:
             self.status_bar.set_status(f"Failed to open game directory: {e}")
     
+    @_requires_database
     def open_mods_directory(self):
         """Open the mods storage directory in file explorer"""
-        mods_dir = self.config_manager.get_mods_directory() if hasattr(self, 'config_manager') else None
+        mods_dir = self.config_manager.get_mods_directory()
         if not mods_dir or not os.path.exists(mods_dir):
             self.status_bar.set_status("Mods directory not set or does not exist. Please configure it in Settings.")
             return
@@ -2106,13 +2533,24 @@ class MainWindow:
     
     def show_task_monitor(self):
         """Show the task monitor dialog"""
+        from gui import TaskMonitorDialog
         dialog = TaskMonitorDialog(self)  
         dialog.show()
     
     def show_shortcuts(self):
         """Show keyboard shortcuts dialog"""
+        # Reuse the dialog built on first open; closing it only hides it
+        dialog = self._shortcuts_dialog
+        if dialog is not None and dialog.winfo_exists():
+            self._center_on_root(dialog)
+            dialog.deiconify()
+            dialog.lift()
+            dialog.grab_set()
+            return
+        
         # Create shortcuts dialog
         dialog = tk.Toplevel(self.root)
+        self._shortcuts_dialog = dialog
         dialog.title("Keyboard Shortcuts")
         dialog.transient(self.root)
         dialog.grab_set()
@@ -2120,7 +2558,6 @@ class MainWindow:
         
         # Set dialog icon
         try:
-            import config as app_config
             app_config.set_window_icon(dialog)
         except Exception as e:
             logger.debug(f"Could not set shortcuts dialog icon: {e}")
@@ -2149,58 +2586,39 @@ class MainWindow:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Define all keyboard shortcuts with categories
-        shortcuts = {
-            "File Operations": [
-                ("Ctrl+O", "Add Mod from URL"),
-                ("Ctrl+Shift+O", "Add Mod from File"),
-                ("Delete", "Remove Selected Mod")
-            ],
-            "Mod Management": [
-                ("F5", "Check for Updates"),
-                ("Ctrl+U", "Update All Mods"),
-                ("Ctrl+D", "Deploy Changes"),
-                ("Ctrl+Shift+E", "Enable All Mods"),
-                ("Ctrl+Shift+D", "Disable All Mods")
-            ],
-            "Navigation": [
-                ("Ctrl+S", "Open Settings"),
-                ("F1", "Show About Dialog")
-            ]
-        }
-        
-        # Add shortcuts to scrollable frame
-        for category, shortcut_list in shortcuts.items():
+        # Add shortcuts to scrollable frame, laid out as one grid rather than a frame per row
+        scrollable_frame.columnconfigure(1, weight=1)
+        row = 0
+        for category, shortcut_list in _SHORTCUTS_DATA.items():
             # Category header
             category_label = ttk_bootstrap.Label(
                 scrollable_frame,
                 text=category,
                 font=("TkDefaultFont", 11, "bold")
             )
-            category_label.pack(anchor="w", pady=(15, 5))
+            category_label.grid(row=row, column=0, columnspan=2, sticky="w", pady=(15, 5))
+            row += 1
             
             # Shortcuts in this category
             for shortcut, description in shortcut_list:
-                shortcut_frame = ttk_bootstrap.Frame(scrollable_frame)
-                shortcut_frame.pack(fill=X, pady=2)
-                
                 # Shortcut key (right-aligned)
                 shortcut_label = ttk_bootstrap.Label(
-                    shortcut_frame,
+                    scrollable_frame,
                     text=shortcut,
                     font=("Consolas", 9),
                     width=15,
                     anchor="e"
                 )
-                shortcut_label.pack(side=LEFT, padx=(10, 10))
+                shortcut_label.grid(row=row, column=0, sticky="e", padx=(10, 10), pady=2)
                 
                 # Description
                 desc_label = ttk_bootstrap.Label(
-                    shortcut_frame,
+                    scrollable_frame,
                     text=description,
                     font=("TkDefaultFont", 9)
                 )
-                desc_label.pack(side=LEFT, fill=X, expand=True)
+                desc_label.grid(row=row, column=1, sticky="ew", pady=2)
+                row += 1
         
         # Pack canvas and scrollbar
         canvas.pack(side="left", fill="both", expand=True)
@@ -2222,19 +2640,22 @@ class MainWindow:
         button_frame = ttk_bootstrap.Frame(main_frame)
         button_frame.pack(fill=X, pady=(20, 0))
         
+        def hide_dialog():
+            dialog.grab_release()
+            dialog.withdraw()
+        
         close_button = ttk_bootstrap.Button(
             button_frame,
             text="Close",
-            command=dialog.destroy,
+            command=hide_dialog,
             bootstyle=PRIMARY
         )
         close_button.pack(side=RIGHT)
+        dialog.protocol("WM_DELETE_WINDOW", hide_dialog)
         
         # Center dialog on parent
         dialog.update_idletasks()
-        x = (self.root.winfo_rootx() + self.root.winfo_width() // 2 - dialog.winfo_width() // 2)
-        y = (self.root.winfo_rooty() + self.root.winfo_height() // 2 - dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
+        self._center_on_root(dialog)
         
         # Make canvas scrollable with mouse wheel
         def _on_mousewheel(event):
@@ -2243,31 +2664,26 @@ class MainWindow:
         canvas.bind("<MouseWheel>", _on_mousewheel)
         dialog.bind("<MouseWheel>", _on_mousewheel)
     
-    def show_about(self):
+    def _center_on_root(self, dialog):
+        """Position a dialog over the centre of the main window"""
+        x = (self.root.winfo_rootx() + self.root.winfo_width() // 2 - dialog.winfo_width() // 2)
+        y = (self.root.winfo_rooty() + self.root.winfo_height() // 2 - dialog.winfo_height() // 2)
+        dialog.geometry(f"+{x}+{y}")
+    
+    def show_about(self, event=None):
         """Show about dialog"""
-        messagebox.showinfo(
-            "About Stalker 2 Mod Manager",
-            "Stalker 2 Mod Manager v1.0\n\n"
-            "A lightweight mod manager for Stalker 2: Heart of Chornobyl\n\n"
-            "Features:\n"
-            "• Download mods from Nexus Mods\n"
-            "• Install mods from local files\n"
-            "• Selective file deployment\n"
-            "• Automatic update checking\n"
-            "• Enable/disable mods easily"
-        )
+        messagebox.showinfo("About Stalker 2 Mod Manager", _ABOUT_TEXT)
     
     def close_application(self):
         """Properly close the application with cleanup"""
         try:
             # Check for running background tasks
-            from utils.thread_manager import get_thread_manager
-            
             thread_manager = get_thread_manager()
             running_tasks = thread_manager.get_running_tasks()
             
             if running_tasks:
                 # Show shutdown confirmation dialog
+                from gui import ShutdownConfirmationDialog
                 dialog = ShutdownConfirmationDialog(self, running_tasks)  
                 result = dialog.show()
                 
@@ -2305,13 +2721,16 @@ class MainWindow:
             if not shutdown_success:
                 logger.warning("Warning: Some background tasks may not have completed cleanly")
             
-            # Close database connections
-            if hasattr(self, 'db_manager') and self.db_manager:
-                # The database connection is handled via context managers
-                # No explicit cleanup needed, but we can log it
-                logger.info("Database connections will be closed automatically")
+            # Stop the archive scan pool without blocking on in-flight scans
+            self._scan_pool.shutdown(wait=False, cancel_futures=True)
+            
+            # Abandon any Nexus lookups still queued
+            self._nexus_pool.shutdown(wait=False, cancel_futures=True)
             
-            # Close Nexus API client session
+            # Let queued archive deletions finish so no stale files are left behind
+            self._cleanup_pool.shutdown(wait=True)
+            
+            # Close Nexus API client session (this also saves its HTTP cache to the database)
             if hasattr(self, 'nexus_client') and self.nexus_client:
                 try:
                     self.nexus_client.close()
@@ -2319,6 +2738,13 @@ class MainWindow:
                 except Exception as e:
                     logger.error(f"Error closing Nexus API client: {e}")
             
+            # Close database connections, including those opened by worker threads
+            if hasattr(self, 'db_manager') and self.db_manager:
+                try:
+                    self.db_manager.close()
+                except Exception as e:
+                    logger.error(f"Error closing database: {e}")
+            
             # Any other cleanup operations can go here
             logger.info("Application cleanup completed")
             
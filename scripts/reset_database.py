@@ -26,6 +26,14 @@ def main():
     else:
         print("📄 No existing database found")
     
+    # WAL mode keeps sidecar files next to the database; a leftover -wal would be
+    # replayed against the recreated database
+    for suffix in ("-wal", "-shm"):
+        sidecar_path = db_path.with_name(db_path.name + suffix)
+        if sidecar_path.exists():
+            sidecar_path.unlink()
+            print(f"   ✅ Removed {sidecar_path.name}")
+    
     print("🔄 Database will be recreated on next application run")
     print("💡 Run 'python main.py' to start with a fresh database")
     print("💡 Run 'python show_db_info.py' to view database information")
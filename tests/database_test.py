@@ -6,7 +6,10 @@ import os
 import sys
 import tempfile
 import shutil
+import sqlite3
+import threading
 import logging
+from contextlib import ExitStack
 from pathlib import Path
 
 # Setup logging for testing
@@ -15,7 +18,7 @@ logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database.models import DatabaseManager, ConfigManager, ModManager, ArchiveManager, DeploymentManager
+from database.models import DatabaseManager, ConfigManager, ModManager, ArchiveManager, DeploymentManager, HttpCacheManager
 
 
 class DatabaseTests:
@@ -28,6 +31,7 @@ class DatabaseTests:
         self.mod_manager = None
         self.archive_manager = None
         self.deployment_manager = None
+        self.http_cache_manager = None
     
     def setup(self):
         """Setup test environment"""
@@ -43,12 +47,14 @@ class DatabaseTests:
         self.mod_manager = ModManager(self.db_manager)
         self.archive_manager = ArchiveManager(self.db_manager)
         self.deployment_manager = DeploymentManager(self.db_manager)
+        self.http_cache_manager = HttpCacheManager(self.db_manager)
         
         print(f"Test database created at: {test_db_path}")
     
     def teardown(self):
         """Clean up test environment"""
         if self.test_dir and os.path.exists(self.test_dir):
+            self.db_manager.close()
             shutil.rmtree(self.test_dir)
             print("Test environment cleaned up")
     
@@ -233,6 +239,309 @@ class DatabaseTests:
         print("✅ Archive manager test passed")
         return archive_id, archive_id2
     
+    def test_transactions(self):
+        """Test grouping writes with transaction()"""
+        print("\n=== Testing Transactions ===")
+        
+        # Writes inside the block are visible to this thread and committed together
+        with self.db_manager.transaction():
+            mod_id = self.mod_manager.add_mod({"mod_name": "Transaction Mod"})
+            self.config_manager.set_config("transaction_key", "committed")
+            assert self.mod_manager.get_mod(mod_id) is not None, "Uncommitted mod should be visible inside the transaction"
+        
+        assert self.mod_manager.get_mod(mod_id) is not None, "Mod should be committed"
+        assert self.config_manager.get_config("transaction_key") == "committed"
+        
+        # An exception rolls back every write in the block, including nested blocks
+        try:
+            with self.db_manager.transaction():
+                self.mod_manager.update_mod(mod_id, {"latest_version": "9.9.9"})
+                with self.db_manager.transaction():
+                    self.mod_manager.add_mod({"mod_name": "Rolled Back Mod"})
+                raise RuntimeError("abort transaction")
+        except RuntimeError:
+            pass
+        
+        assert not self.mod_manager.exists_by_name("Rolled Back Mod"), "Nested write should be rolled back"
+        assert self.mod_manager.get_mod(mod_id)["latest_version"] != "9.9.9", "Outer write should be rolled back"
+        
+        # The connection is usable again after a rollback
+        self.mod_manager.remove_mod(mod_id)
+        self.config_manager.delete_config("transaction_key")
+        assert self.mod_manager.get_mod(mod_id) is None, "Mod should be removed after the transaction"
+        
+        print("✅ Transactions test passed")
+    
+    def test_read_pool(self):
+        """Test the pooled read-only connections used by execute_query"""
+        print("\n=== Testing Read Connection Pool ===")
+        
+        # Pooled connections refuse writes
+        with self.db_manager._read_connection() as conn:
+            try:
+                conn.execute("INSERT INTO config (key, value) VALUES ('pool_key', 'x')")
+                assert False, "Read-only connection should reject writes"
+            except sqlite3.OperationalError as e:
+                print(f"Correctly rejected write: {e}")
+        
+        # Connections are returned to the pool and reused
+        with self.db_manager._read_connection() as first:
+            pass
+        with self.db_manager._read_connection() as second:
+            assert second is first, "Most recently returned connection should be reused"
+        
+        # Borrowers at once get distinct connections, and the idle pool stays bounded
+        with ExitStack() as stack:
+            borrowed = [
+                stack.enter_context(self.db_manager._read_connection())
+                for _ in range(DatabaseManager.READ_POOL_SIZE + 2)
+            ]
+            assert len(set(map(id, borrowed))) == len(borrowed), "Concurrent borrowers should not share a connection"
+        assert len(self.db_manager._read_pool) == DatabaseManager.READ_POOL_SIZE, "Idle pool should not exceed its size"
+        
+        # Committed writes are visible through the pool
+        self.config_manager.set_config("pool_key", "visible")
+        assert self.config_manager.get_config("pool_key") == "visible"
+        self.config_manager.delete_config("pool_key")
+        
+        print("✅ Read connection pool test passed")
+    
+    def test_bulk_mod_operations(self):
+        """Test multi-mod updates and existence checks"""
+        print("\n=== Testing Bulk Mod Operations ===")
+        
+        mod_ids = [
+            self.mod_manager.add_mod({"mod_name": f"Bulk Mod {i}", "enabled": False})
+            for i in range(3)
+        ]
+        
+        # Name lookup ignores case
+        assert self.mod_manager.exists_by_name("bulk mod 1"), "Name lookup should be case-insensitive"
+        assert not self.mod_manager.exists_by_name("Missing Mod")
+        assert self.mod_manager.has_any_mods()
+        
+        # set_mod_enabled returns the updated row
+        updated = self.mod_manager.set_mod_enabled(mod_ids[0], True)
+        assert updated is not None and updated["id"] == mod_ids[0]
+        assert updated["enabled"] == 1, "Returned row should reflect the update"
+        assert self.mod_manager.set_mod_enabled(99999, True) is None, "Unknown mod should return None"
+        
+        # Bulk enable counts only the rows that exist
+        assert self.mod_manager.bulk_set_enabled(mod_ids + [99999], True) == 3
+        assert all(self.mod_manager.get_mod(mod_id)["enabled"] == 1 for mod_id in mod_ids)
+        assert self.mod_manager.bulk_set_enabled([], False) == 0
+        
+        # Bulk remove counts only the rows that exist
+        assert self.mod_manager.remove_mods(mod_ids[:2] + [99999]) == 2
+        assert self.mod_manager.get_mod(mod_ids[0]) is None
+        assert self.mod_manager.get_mod(mod_ids[2]) is not None, "Unlisted mod should be kept"
+        
+        # Clean up
+        self.mod_manager.remove_mods(mod_ids[2:])
+        
+        print("✅ Bulk mod operations test passed")
+    
+    def test_mod_name_ordering(self):
+        """Test that mods are listed by name ignoring case, using the NOCASE index"""
+        print("\n=== Testing Mod Name Ordering ===")
+        
+        existing_ids = {mod["id"] for mod in self.mod_manager.get_all_mods()}
+        mod_ids = [
+            self.mod_manager.add_mod({"mod_name": name})
+            for name in ("beta Mod", "Alpha Mod", "charlie Mod", "ALPHA Mod 2")
+        ]
+        
+        names = [mod["mod_name"] for mod in self.mod_manager.get_all_mods() if mod["id"] not in existing_ids]
+        assert names == ["Alpha Mod", "ALPHA Mod 2", "beta Mod", "charlie Mod"], f"Unexpected order: {names}"
+        
+        # The listing and name lookup are served by idx_mods_name_nocase, with no sort step
+        plan = " ".join(row["detail"] for row in self.db_manager.execute_query(
+            "EXPLAIN QUERY PLAN SELECT * FROM mods ORDER BY mod_name COLLATE NOCASE"
+        ))
+        assert "idx_mods_name_nocase" in plan and "TEMP B-TREE" not in plan, f"Ordering should use the index: {plan}"
+        plan = " ".join(row["detail"] for row in self.db_manager.execute_query(
+            "EXPLAIN QUERY PLAN SELECT 1 FROM mods WHERE mod_name = ? COLLATE NOCASE LIMIT 1", ("alpha mod",)
+        ))
+        assert "idx_mods_name_nocase" in plan, f"Name lookup should use the index: {plan}"
+        
+        # Clean up
+        self.mod_manager.remove_mods(mod_ids)
+        
+        print("✅ Mod name ordering test passed")
+    
+    def test_batch_lookups(self):
+        """Test the per-mod lookups that fetch several mods at once"""
+        print("\n=== Testing Batch Lookups ===")
+        
+        mod_a = self.mod_manager.add_mod({"mod_name": "Batch Mod A"})
+        mod_b = self.mod_manager.add_mod({"mod_name": "Batch Mod B"})
+        mod_c = self.mod_manager.add_mod({"mod_name": "Batch Mod C"})
+        
+        # Archives keyed by mod, newest first; mods without archives are absent
+        self.archive_manager.add_archive(mod_id=mod_a, version="1.0", file_name="batch_a_1.0.zip", file_size=10)
+        self.archive_manager.add_archive(mod_id=mod_a, version="2.0", file_name="batch_a_2.0.zip", file_size=20)
+        self.archive_manager.add_archive(mod_id=mod_b, version="1.0", file_name="batch_b_1.0.zip", file_size=30)
+        
+        archives = self.archive_manager.get_archives_for_mods([mod_a, mod_b, mod_c])
+        assert set(archives) == {mod_a, mod_b}, "Only mods with archives should be keyed"
+        assert len(archives[mod_a]) == 2 and len(archives[mod_b]) == 1
+        assert self.archive_manager.get_archives_for_mods([]) == {}
+        
+        # Selections keyed by mod, sorted by path
+        self.deployment_manager.save_deployment_selections(mod_a, ["b.pak", "a.pak"])
+        self.deployment_manager.save_deployment_selections(mod_c, ["c.pak"])
+        
+        selections = self.deployment_manager.get_selections_for_mods([mod_a, mod_b, mod_c])
+        assert selections == {mod_a: ["a.pak", "b.pak"], mod_c: ["c.pak"]}
+        assert self.deployment_manager.mods_with_selections([mod_a, mod_b, mod_c]) == {mod_a, mod_c}
+        assert self.deployment_manager.mods_with_selections([]) == set()
+        
+        # Deployed files recorded in one batch
+        self.deployment_manager.add_deployed_files([
+            (mod_a, "a.pak", "C:/Game/Mods/a.pak", None),
+            (mod_a, "b.pak", "C:/Game/Mods/b.pak", "C:/Backup/b.pak.bak"),
+            (mod_c, "c.pak", "C:/Game/Mods/c.pak", None),
+        ])
+        assert len(self.deployment_manager.get_deployed_files(mod_a)) == 2
+        assert len(self.deployment_manager.get_deployed_files(mod_c)) == 1
+        self.deployment_manager.add_deployed_files([])
+        
+        # Several config values set at once
+        self.config_manager.set_many({"batch_key_1": "one", "batch_key_2": "two"})
+        assert self.config_manager.get_config("batch_key_1") == "one"
+        assert self.config_manager.get_config("batch_key_2") == "two"
+        self.config_manager.delete_config("batch_key_1")
+        self.config_manager.delete_config("batch_key_2")
+        
+        # Clean up; related rows cascade with the mods
+        self.mod_manager.remove_mods([mod_a, mod_b, mod_c])
+        assert self.deployment_manager.get_deployed_files(mod_a) == []
+        
+        print("✅ Batch lookups test passed")
+    
+    def test_http_cache_manager(self):
+        """Test persisting HTTP cache entries"""
+        print("\n=== Testing HTTP Cache Manager ===")
+        
+        entries = {
+            "https://api.nexusmods.com/v1/games/stalker2/mods/1.json": ('"etag-1"', None, {"name": "Mod One"}),
+            "https://api.nexusmods.com/v1/games/stalker2/mods/2.json": (None, "Wed, 01 Jan 2025 00:00:00 GMT", [1, 2]),
+        }
+        self.http_cache_manager.save_entries(entries)
+        
+        loaded = self.http_cache_manager.load_entries()
+        assert loaded == entries, "Loaded entries should round-trip"
+        
+        # Saving again replaces existing entries
+        url = "https://api.nexusmods.com/v1/games/stalker2/mods/1.json"
+        self.http_cache_manager.save_entries({url: ('"etag-2"', None, {"name": "Mod One v2"})})
+        assert self.http_cache_manager.load_entries()[url] == ('"etag-2"', None, {"name": "Mod One v2"})
+        
+        # Entries older than the max age are dropped
+        self.db_manager.execute_command(
+            "UPDATE http_cache SET cached_at = datetime('now', '-2 days') WHERE url = ?", (url,)
+        )
+        loaded = self.http_cache_manager.load_entries(max_age_seconds=24 * 60 * 60)
+        assert url not in loaded and len(loaded) == 1, "Expired entry should be dropped"
+        
+        # Clean up
+        self.db_manager.execute_command("DELETE FROM http_cache")
+        
+        print("✅ HTTP cache manager test passed")
+    
+    def test_worker_thread_connections(self):
+        """Test that short-lived worker threads don't leave connections open"""
+        print("\n=== Testing Worker Thread Connections ===")
+        
+        def task(index):
+            # Mirrors a background task: a few writes, a transaction and a read
+            self.config_manager.set_config(f"worker_key_{index}", "value")
+            with self.db_manager.transaction():
+                self.config_manager.set_config(f"worker_txn_{index}", "value")
+            self.config_manager.get_config(f"worker_key_{index}")
+        
+        # Warm up this thread's connection and the read pool first
+        task(0)
+        baseline = len(self.db_manager._open_connections)
+        
+        # Each background task runs on a new thread, as thread_manager.create_task does
+        for index in range(1, 51):
+            thread = threading.Thread(target=task, args=(index,))
+            thread.start()
+            thread.join()
+        
+        open_count = len(self.db_manager._open_connections)
+        assert open_count <= baseline, f"Worker threads leaked connections: {baseline} -> {open_count}"
+        assert self.config_manager.get_config("worker_txn_50") == "value", "Worker writes should be committed"
+        
+        # Clean up
+        self.db_manager.execute_command("DELETE FROM config WHERE key LIKE 'worker_%'")
+        
+        print("✅ Worker thread connections test passed")
+    
+    def test_concurrent_writer_connections(self):
+        """Test that concurrent writer threads keep the open connection count bounded"""
+        print("\n=== Testing Concurrent Writer Connections ===")
+        
+        writer_count = 8
+        writes_per_thread = 10
+        baseline = len(self.db_manager._open_connections)
+        peak = [baseline]
+        errors = []
+        start = threading.Barrier(writer_count)
+        
+        def writer(index):
+            try:
+                start.wait()
+                for n in range(writes_per_thread):
+                    self.config_manager.set_config(f"concurrent_{index}_{n}", str(n))
+                    self.config_manager.get_config(f"concurrent_{index}_{n}")
+                    peak[0] = max(peak[0], len(self.db_manager._open_connections))
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(writer_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert not errors, f"Writer threads failed: {errors}"
+        
+        # While running, at most one connection per writer plus the read pool
+        limit = baseline + writer_count + DatabaseManager.READ_POOL_SIZE
+        assert peak[0] <= limit, f"Open connections peaked at {peak[0]}, expected at most {limit}"
+        
+        # Once the writers finish, only the pooled readers may remain
+        open_count = len(self.db_manager._open_connections)
+        assert open_count <= baseline + DatabaseManager.READ_POOL_SIZE, f"{open_count} connections left open after writers finished"
+        
+        rows = self.db_manager.execute_query("SELECT COUNT(*) AS count FROM config WHERE key LIKE 'concurrent_%'")
+        assert rows[0]["count"] == writer_count * writes_per_thread, "Every concurrent write should be committed"
+        
+        # Clean up
+        self.db_manager.execute_command("DELETE FROM config WHERE key LIKE 'concurrent_%'")
+        
+        print("✅ Concurrent writer connections test passed")
+    
+    def test_close_connections(self):
+        """Test closing every connection and reopening on next use"""
+        print("\n=== Testing Closing Connections ===")
+        
+        self.mod_manager.get_all_mods()
+        self.config_manager.set_config("close_key", "value")
+        self.db_manager.close()
+        
+        # The last close checkpoints the WAL and removes its sidecar files
+        wal_path = f"{self.db_manager.db_path}-wal"
+        assert not os.path.exists(wal_path), "WAL file should be removed after close"
+        
+        # The manager reopens connections transparently
+        assert self.config_manager.get_config("close_key") == "value"
+        self.config_manager.delete_config("close_key")
+        
+        print("✅ Closing connections test passed")
+    
     def test_deployment_manager(self, mod_id):
         """Test deployment management"""
         print("\n=== Testing Deployment Manager ===")
@@ -358,6 +667,15 @@ class DatabaseTests:
             self.test_config_manager()
             mod_id, mod_id2 = self.test_mod_manager()
             archive_id, archive_id2 = self.test_archive_manager(mod_id)
+            self.test_transactions()
+            self.test_read_pool()
+            self.test_bulk_mod_operations()
+            self.test_mod_name_ordering()
+            self.test_batch_lookups()
+            self.test_http_cache_manager()
+            self.test_worker_thread_connections()
+            self.test_concurrent_writer_connections()
+            self.test_close_connections()
             self.test_deployment_manager(mod_id)
             self.test_cascading_deletes(mod_id)
             self.test_error_handling()
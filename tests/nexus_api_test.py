@@ -6,6 +6,7 @@ import os
 import sys
 import tempfile
 import shutil
+import json
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import requests
@@ -154,6 +155,23 @@ class TestNexusModsClient(unittest.TestCase):
         self.assertIsNotNone(self.client.daily_reset)
         self.assertIsNotNone(self.client.hourly_reset)
     
+    @patch('requests.Session.request')
+    def test_rate_limiter_ignores_low_hourly_quota(self, mock_request):
+        """Test a low hourly quota is recorded but does not slow request pacing"""
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.status_code = 200
+        mock_response.headers = {'X-RL-Hourly-Remaining': '5', 'X-RL-Daily-Remaining': '2000'}
+        mock_response.json.return_value = {"test": "response"}
+        mock_request.return_value = mock_response
+        
+        self.client.validate_api_key()
+        
+        limiter = self.client._rate_limiter
+        self.assertEqual(self.client.hourly_remaining, 5)
+        self.assertEqual(limiter.rate, self.client.RATE_LIMIT_PER_SECOND)
+        self.assertGreater(limiter.tokens, 5)
+    
     @patch('requests.Session.request')
     def test_validate_api_key_success(self, mock_request):
         """Test successful API key validation"""
@@ -213,6 +231,60 @@ class TestNexusModsClient(unittest.TestCase):
         self.assertEqual(result["name"], "Test Mod")
         self.assertEqual(result["version"], "1.0.0")
     
+    @patch('requests.Session.request')
+    def test_get_mod_info_cached(self, mock_request):
+        """Test repeated mod info lookups reuse the cached response"""
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.headers = {}
+        mock_response.json.return_value = {"mod_id": 123, "name": "Test Mod", "version": "1.0.0"}
+        mock_request.return_value = mock_response
+        
+        self.client.get_mod_info(123)
+        self.client.get_mod_info(123)
+        self.assertEqual(mock_request.call_count, 1)
+        
+        self.client.invalidate_mod_info(123)
+        self.client.get_mod_info(123)
+        self.assertEqual(mock_request.call_count, 2)
+    
+    @patch('requests.Session.request')
+    def test_get_file_info_cached(self, mock_request):
+        """Test repeated file info lookups reuse the cached response"""
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.headers = {}
+        mock_response.json.return_value = {"file_id": 456, "name": "Main File"}
+        mock_request.return_value = mock_response
+        
+        self.client.get_file_info(123, 456)
+        result = self.client.get_file_info(123, 456)
+        
+        self.assertEqual(result["name"], "Main File")
+        self.assertEqual(mock_request.call_count, 1)
+    
+    @patch('requests.Session.request')
+    def test_conditional_get_not_modified(self, mock_request):
+        """Test a 304 response reuses the body cached from the previous fetch"""
+        first_response = Mock()
+        first_response.ok = True
+        first_response.status_code = 200
+        first_response.headers = {"ETag": '"abc123"'}
+        first_response.json.return_value = {"files": [{"file_id": 456, "name": "Main File"}]}
+        
+        not_modified = Mock()
+        not_modified.ok = True
+        not_modified.status_code = 304
+        not_modified.headers = {}
+        mock_request.side_effect = [first_response, not_modified]
+        
+        self.client.get_mod_files(123)
+        result = self.client.get_mod_files(123)
+        
+        self.assertEqual(result[0]["name"], "Main File")
+        args, kwargs = mock_request.call_args
+        self.assertEqual(kwargs["headers"]["If-None-Match"], '"abc123"')
+    
     @patch('requests.Session.request')
     def test_get_file_info_success(self, mock_request):
         """Test successful file info retrieval"""
@@ -457,6 +529,132 @@ class TestNexusModsClient(unittest.TestCase):
         for url in invalid_urls:
             self.assertFalse(NexusModsClient.is_valid_nexus_url(url), 
                            f"Should be invalid: {url}")
+    
+    def test_download_file_writes_stream(self):
+        """Test download_file writes the streamed chunks and returns the byte count"""
+        chunks = [b"abc", b"def"]
+        mock_response = MagicMock()
+        mock_response.headers = {"content-length": "6"}
+        mock_response.iter_content.return_value = chunks
+        mock_response.__enter__.return_value = mock_response
+        
+        temp_dir = tempfile.mkdtemp()
+        try:
+            target = os.path.join(temp_dir, "mod.zip")
+            with patch.object(self.client.download_session, "get", return_value=mock_response):
+                written = self.client.download_file("https://example.com/mod.zip", target)
+            
+            self.assertEqual(written, 6)
+            with open(target, "rb") as f:
+                self.assertEqual(f.read(), b"abcdef")
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_download_file_resumes_partial(self):
+        """Test download_file continues a verified .part file with Range and If-Range"""
+        mock_response = MagicMock()
+        mock_response.status_code = 206
+        mock_response.headers = {"content-length": "3", "Content-Range": "bytes 3-5/6"}
+        mock_response.iter_content.return_value = [b"def"]
+        mock_response.__enter__.return_value = mock_response
+        
+        temp_dir = tempfile.mkdtemp()
+        try:
+            target = os.path.join(temp_dir, "mod.zip")
+            with open(target + ".part", "wb") as f:
+                f.write(b"abc")
+            with open(target + ".part.json", "w") as f:
+                json.dump({"validator": '"v1"', "total_size": 6}, f)
+            with patch.object(self.client.download_session, "get", return_value=mock_response) as mock_get:
+                written = self.client.download_file("https://example.com/mod.zip", target)
+            
+            self.assertEqual(mock_get.call_args[1]["headers"], {"Range": "bytes=3-", "If-Range": '"v1"'})
+            self.assertEqual(written, 6)
+            with open(target, "rb") as f:
+                self.assertEqual(f.read(), b"abcdef")
+            self.assertFalse(os.path.exists(target + ".part"))
+            self.assertFalse(os.path.exists(target + ".part.json"))
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_download_file_restarts_changed_file(self):
+        """Test download_file replaces a .part file when If-Range fails and the whole file is sent"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-length": "6", "ETag": '"v2"'}
+        mock_response.iter_content.return_value = [b"uvwxyz"]
+        mock_response.__enter__.return_value = mock_response
+        
+        temp_dir = tempfile.mkdtemp()
+        try:
+            target = os.path.join(temp_dir, "mod.zip")
+            with open(target + ".part", "wb") as f:
+                f.write(b"abc")
+            with open(target + ".part.json", "w") as f:
+                json.dump({"validator": '"v1"', "total_size": 6}, f)
+            with patch.object(self.client.download_session, "get", return_value=mock_response):
+                written = self.client.download_file("https://example.com/mod.zip", target)
+            
+            self.assertEqual(written, 6)
+            with open(target, "rb") as f:
+                self.assertEqual(f.read(), b"uvwxyz")
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_download_file_discards_unverified_partial(self):
+        """Test download_file doesn't resume a .part file that has no saved validator"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-length": "6"}
+        mock_response.iter_content.return_value = [b"abcdef"]
+        mock_response.__enter__.return_value = mock_response
+        
+        temp_dir = tempfile.mkdtemp()
+        try:
+            target = os.path.join(temp_dir, "mod.zip")
+            with open(target + ".part", "wb") as f:
+                f.write(b"old")
+            with patch.object(self.client.download_session, "get", return_value=mock_response) as mock_get:
+                written = self.client.download_file("https://example.com/mod.zip", target)
+            
+            self.assertIsNone(mock_get.call_args[1]["headers"])
+            self.assertEqual(written, 6)
+            with open(target, "rb") as f:
+                self.assertEqual(f.read(), b"abcdef")
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_download_file_rejects_mismatched_range(self):
+        """Test download_file starts over when a 206 reply doesn't match the saved file size"""
+        mismatched = MagicMock()
+        mismatched.status_code = 206
+        mismatched.headers = {"content-length": "5", "Content-Range": "bytes 3-7/8"}
+        mismatched.iter_content.return_value = [b"ghijk"]
+        mismatched.__enter__.return_value = mismatched
+        
+        full = MagicMock()
+        full.status_code = 200
+        full.headers = {"content-length": "8", "ETag": '"v1"'}
+        full.iter_content.return_value = [b"abcdefgh"]
+        full.__enter__.return_value = full
+        
+        temp_dir = tempfile.mkdtemp()
+        try:
+            target = os.path.join(temp_dir, "mod.zip")
+            with open(target + ".part", "wb") as f:
+                f.write(b"abc")
+            with open(target + ".part.json", "w") as f:
+                json.dump({"validator": '"v1"', "total_size": 6}, f)
+            with patch.object(self.client.download_session, "get", side_effect=[mismatched, full]) as mock_get:
+                written = self.client.download_file("https://example.com/mod.zip", target)
+            
+            self.assertEqual(mock_get.call_count, 2)
+            self.assertIsNone(mock_get.call_args[1]["headers"])
+            self.assertEqual(written, 8)
+            with open(target, "rb") as f:
+                self.assertEqual(f.read(), b"abcdefgh")
+        finally:
+            shutil.rmtree(temp_dir)
 
 
 class TestModDownloader(unittest.TestCase):
@@ -204,6 +204,9 @@ class FileDeploymentManager:
                 # Extract archive
                 self._extract_archive_to_temp(archive_path, temp_path)
                 
+                # Deployment records, written in one batch once the files are copied
+                deployed_rows = []
+                
                 # Deploy each selected file
                 for file_path in selected_files:
                     try:
@@ -229,12 +232,8 @@ class FileDeploymentManager:
                         shutil.copy2(source_file, target_file)
                         results["deployed_files"][file_path] = str(target_file)
                         
-                        # Record deployment in database
-                        deployment_manager.add_deployed_file(
-                            mod_id=mod_id,
-                            source_path=file_path,
-                            deployed_path=str(target_file),
-                            original_backup_path=str(backup_path) if backup_path else None
+                        deployed_rows.append(
+                            (mod_id, file_path, str(target_file), str(backup_path) if backup_path else None)
                         )
                         
                         self.logger.debug(f"Deployed: {file_path} -> {target_file}")
@@ -243,6 +242,14 @@ class FileDeploymentManager:
                         error_msg = f"Failed to deploy {file_path}: {e}"
                         results["errors"].append(error_msg)
                         self.logger.error(error_msg)
+                
+                # Record deployments in database
+                try:
+                    deployment_manager.add_deployed_files(deployed_rows)
+                except Exception as e:
+                    error_msg = f"Failed to record deployed files for mod {mod_id}: {e}"
+                    results["errors"].append(error_msg)
+                    self.logger.error(error_msg)
             
             # Log summary
             deployed_count = len(results["deployed_files"])
@@ -273,8 +280,11 @@ class FileDeploymentManager:
                     backup_path = file_record.get("original_backup_path")
                     
                     # Remove the deployed file if it exists
-                    if deployed_path.exists():
+                    try:
                         deployed_path.unlink()
+                    except FileNotFoundError:
+                        pass
+                    else:
                         results["removed_files"].append(str(deployed_path))
                         self.logger.debug(f"Removed deployed file: {deployed_path}")
                     
@@ -471,11 +481,10 @@ class ArchiveManager:
         except Exception as e:
             self.logger.error(f"Error copying archive {source_path}: {e}")
             # Clean up partial copy if it exists
-            if destination_path.exists():
-                try:
-                    destination_path.unlink()
-                except:
-                    pass
+            try:
+                destination_path.unlink(missing_ok=True)
+            except OSError:
+                pass
             raise
     
     def remove_archive(self, archive_filename: str) -> None:
@@ -623,9 +632,11 @@ class GameDirectoryManager:
         deployed_files = []
         
         try:
-            # Use temporary directory to extract files
+            # Extract inside the game directory's backup folder: it is on the same filesystem
+            # as the mods directory, so os.replace can move deployed files into place, which
+            # fails across volumes
             archive_handler = ArchiveHandler()
-            with tempfile.TemporaryDirectory() as temp_dir:
+            with tempfile.TemporaryDirectory(dir=self.backup_directory) as temp_dir:
                 temp_path = Path(temp_dir)
                 
                 # Extract selected files from archive
@@ -647,8 +658,12 @@ class GameDirectoryManager:
                         if source_file.is_dir():
                             continue
                         
-                        # Copy the file directly to mods directory
-                        shutil.copy2(source_file, target_path)
+                        # Move the extracted file into the mods directory; the rename only
+                        # fails across filesystems, where we fall back to a copy
+                        try:
+                            os.replace(source_file, target_path)
+                        except OSError:
+                            shutil.copy2(source_file, target_path)
                         
                         # Record the deployment
                         deployment_info = {
@@ -890,8 +905,7 @@ class GameDirectoryManager:
         for file_info in deployed_files:
             try:
                 deployed_path = Path(file_info['deployed_path'])
-                if deployed_path.exists():
-                    deployed_path.unlink()
+                deployed_path.unlink(missing_ok=True)
                 
                 # Restore backup if one was created
                 backup_path = file_info.get('backup_path')
@@ -1279,9 +1293,11 @@ class TempFileManager:
         # Clean up temporary files
         for temp_file in self.temp_files[:]:  # Copy list to avoid modification during iteration
             try:
-                if os.path.exists(temp_file):
+                try:
                     os.unlink(temp_file)
                     self.logger.debug(f"Cleaned up temporary file: {temp_file}")
+                except FileNotFoundError:
+                    pass
                 self.temp_files.remove(temp_file)
             except Exception as e:
                 self.logger.warning(f"Error cleaning up temporary file {temp_file}: {e}")
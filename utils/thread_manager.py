@@ -21,8 +21,10 @@ class TaskType(Enum):
     UPDATE_CHECK = "update_check"
     DEPLOY = "deploy"
     UPDATE_MOD = "update_mod"
+    REMOVE_MOD = "remove_mod"
     API_VALIDATION = "api_validation"
     RATE_LIMIT_CHECK = "rate_limit_check"
+    CLEANUP = "cleanup"
 
 
 class TaskStatus(Enum):
@@ -66,6 +68,8 @@ class ThreadManager:
         self._tasks: Dict[str, BackgroundTask] = {}
         self._task_counter = 0
         self._lock = threading.RLock()
+        # Notified whenever a task stops running, so waiters don't have to poll
+        self._task_finished = threading.Condition(self._lock)
         self._shutdown_event = threading.Event()
         
     def create_task(self, 
@@ -137,6 +141,7 @@ class ThreadManager:
             if task_id in self._tasks:
                 self._tasks[task_id].status = status
                 self._tasks[task_id].end_time = time.time()
+            self._task_finished.notify_all()
     
     def update_task_progress(self, task_id: str, progress: float):
         """Update task progress (0.0 to 1.0)"""
@@ -173,6 +178,7 @@ class ThreadManager:
             # Mark as cancelled
             task.status = TaskStatus.CANCELLED
             task.end_time = time.time()
+            self._task_finished.notify_all()
             
             # Note: We can't actually stop the thread forcibly in Python
             # The thread function should check for cancellation regularly
@@ -223,12 +229,17 @@ class ThreadManager:
         Returns:
             True if all tasks completed, False if timeout occurred
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout if timeout else None
         
-        while self.has_running_tasks():
-            if timeout and (time.time() - start_time) > timeout:
-                return False
-            time.sleep(0.1)
+        with self._task_finished:
+            while self.has_running_tasks():
+                wait_time = 1.0  # Re-check periodically in case a thread died without reporting
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    wait_time = min(wait_time, remaining)
+                self._task_finished.wait(wait_time)
         
         return True
     